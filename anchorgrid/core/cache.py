@@ -0,0 +1,63 @@
+"""
+AnchorGrid Core - In-Process TTL Cache
+
+Small thread-safe LRU with per-entry expiry, for hot lookups that are
+repeated within a data source's refresh window (quotes, agent insights).
+Use Redis (services.redis_service) when the cache must be shared across
+processes.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after `ttl` seconds.
+    
+    Usage:
+        cache = TTLCache(maxsize=4096, ttl=15)
+        cache.set("AAPL", quote)
+        cache.get("AAPL")  # -> quote, or None once expired
+    
+    Pass ttl=float("inf") for a plain LRU (deterministic results).
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing/expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
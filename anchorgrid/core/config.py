@@ -54,6 +54,7 @@ class Settings(BaseSettings):
     
     # Embeddings
     EMBEDDING_BACKEND: str = "ollama"  # "ollama" | "huggingface"
+    EMBED_QUANTIZE: bool = True  # int8-quantize cached embeddings (False = full precision)
     
     # HuggingFace
     HF_API_KEY: str = ""
@@ -63,10 +64,13 @@ class Settings(BaseSettings):
     OLLAMA_URL: str = "http://localhost:11434"
     OLLAMA_EMBED_MODEL: str = "nomic-embed-text"
     OLLAMA_LLM_MODEL: str = "llama3"
+    OLLAMA_EMBED_CONCURRENCY: int = 8  # Parallel requests in embed_batch
     
     # OpenAI (fallback)
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_EMBED_CHUNK_SIZE: int = 256  # Inputs per request (API hard cap: 2048)
+    OPENAI_EMBED_CONCURRENCY: int = 4  # Parallel embedding requests
     
     # Anthropic (fallback)
     ANTHROPIC_API_KEY: str = ""
@@ -75,6 +79,9 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
     
+    # Mock agent provider ("thinking" delay in seconds, 0 to disable)
+    MOCK_AGENT_DELAY: float = 0.8
+    
     # Security
     SECRET_KEY: str = "change-me-in-production"
     JWT_SECRET: str = "change-me-in-production"
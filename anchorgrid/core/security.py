@@ -4,10 +4,13 @@ QuantForge AI Engine - Security Utilities
 JWT tokens, API key hashing, password hashing, and security helpers.
 All functions are stateless — database operations happen in services.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
+import asyncio
 import hashlib
+import os
 import secrets
 
 from jose import JWTError, jwt
@@ -20,7 +23,13 @@ from anchorgrid.core.config import settings
 # Password Hashing
 # =============================================================================
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+
+# bcrypt is CPU-bound (~100ms+); run it off the event loop on a bounded pool
+_kdf_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="kdf",
+)
 
 
 def hash_password(password: str) -> str:
@@ -50,6 +59,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password on the KDF thread pool (for async code paths)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_kdf_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the KDF thread pool (for async code paths)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _kdf_executor, verify_password, plain_password, hashed_password
+    )
+
+
 # =============================================================================
 # API Key Generation & Hashing
 # =============================================================================
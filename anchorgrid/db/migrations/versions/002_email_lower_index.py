@@ -0,0 +1,26 @@
+"""Normalize user emails and index lower(email)
+
+Revision ID: 002_email_lower_index
+Revises: 001_initial
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = "002_email_lower_index"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Lowercase stored emails and enforce case-insensitive uniqueness"""
+    op.execute("UPDATE users SET email = lower(trim(email)) WHERE email <> lower(trim(email))")
+    op.execute("CREATE UNIQUE INDEX ix_users_email_lower ON users (lower(email))")
+
+
+def downgrade() -> None:
+    """Drop the functional index (stored emails stay lowercased)"""
+    op.execute("DROP INDEX IF EXISTS ix_users_email_lower")
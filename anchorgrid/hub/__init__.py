@@ -3,13 +3,30 @@ AnchorGrid Hub - Collective Intelligence Network
 
 The "Hive Mind" - Federated learning infrastructure for community-driven
 model improvement.
+
+Submodules are imported on first attribute access (PEP 562), so
+`import anchorgrid.hub` does not pull in torch/SQLAlchemy up front.
 """
 
-from anchorgrid.hub.registry import AnchorGridHub, AdapterMetadata
-from anchorgrid.hub.evaluation import ProofOfLoss, EvaluationBenchmark
-from anchorgrid.hub.merging import merge_adapters, ModelSoup
-from anchorgrid.hub.auth import KeyGenerator, get_current_user, create_api_key_for_user
-from anchorgrid.hub.submit import prepare_submission
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from anchorgrid.hub.registry import AnchorGridHub, AdapterMetadata
+    from anchorgrid.hub.evaluation import ProofOfLoss, EvaluationBenchmark
+    from anchorgrid.hub.merging import merge_adapters, ModelSoup
+    from anchorgrid.hub.auth import KeyGenerator, get_current_user, create_api_key_for_user
+    from anchorgrid.hub.submit import prepare_submission
+
+# submodule -> public names it provides
+_LAZY = {
+    ".registry": ("AnchorGridHub", "AdapterMetadata"),
+    ".evaluation": ("ProofOfLoss", "EvaluationBenchmark"),
+    ".merging": ("merge_adapters", "ModelSoup"),
+    ".auth": ("KeyGenerator", "get_current_user", "create_api_key_for_user"),
+    ".submit": ("prepare_submission",),
+}
+_LOOKUP = {name: module for module, names in _LAZY.items() for name in names}
 
 __all__ = [
     # Registry Management
@@ -35,3 +52,19 @@ __all__ = [
 
 __version__ = "0.2.0"
 __status__ = "🟢 Hive Mind Active"
+
+
+def __getattr__(name: str):
+    module = _LOOKUP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    submodule = importlib.import_module(module, __name__)
+    # Bind every name the submodule provides, so sibling lookups
+    # (e.g. ProofOfLoss after EvaluationBenchmark) skip __getattr__
+    for sibling in _LAZY[module]:
+        globals()[sibling] = getattr(submodule, sibling)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,10 +12,9 @@ This is how we prevent model poisoning and ensure quality:
 No politics. No bias. Just math.
 """
 
+import weakref
 from typing import Dict, List
 import numpy as np
-import torch
-from transformers import AutoTokenizer
 from loguru import logger
 
 
@@ -60,12 +59,32 @@ class ProofOfLoss:
     def __init__(self, benchmark: EvaluationBenchmark = None):
         self.benchmark = benchmark or EvaluationBenchmark()
         self.official_baseline_loss = 0.5  # TODO: Set from official model
+        # PeftModel -> base model with its LoRA deltas folded in
+        self._merged_models = weakref.WeakKeyDictionary()
+    
+    def _merged_model(self, model):
+        """
+        Fold LoRA deltas into the base weights (W0 + BA) once per model.
+        
+        Merged linear layers run one matmul instead of two per forward pass.
+        merge_and_unload() rewrites the model in place, so the result is
+        cached rather than merged again on the next evaluation.
+        """
+        if not hasattr(model, "merge_and_unload"):
+            return model  # Plain model, nothing to fold
+        
+        merged = self._merged_models.get(model)
+        if merged is None:
+            merged = model.merge_and_unload()
+            self._merged_models[model] = merged
+        return merged
     
     def evaluate_adapter(
         self,
         model,
         tokenizer,
-        num_examples: int = 100
+        num_examples: int = 100,
+        merge: bool = False
     ) -> Dict[str, float]:
         """
         Run evaluation and return metrics.
@@ -74,12 +93,19 @@ class ProofOfLoss:
             model: Model to evaluate
             tokenizer: Tokenizer for the model
             num_examples: Number of examples to test on
+            merge: Fold LoRA weights into the base model before evaluating.
+                This rewrites `model` in place (merge_and_unload), so the
+                adapter can no longer be saved or unmerged afterwards;
+                only pass True for a model loaded just for evaluation.
             
         Returns:
             Dict with loss, accuracy, and other metrics
         """
         logger.info(f"🔬 Running Proof of Loss evaluation on {num_examples} examples...")
         
+        if merge:
+            model = self._merged_model(model)
+        
         total_loss = 0.0
         correct = 0
         
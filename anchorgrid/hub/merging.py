@@ -9,15 +9,42 @@ Based on research:
 - "Task Arithmetic" (Allen AI, 2023)
 """
 
-from typing import List, Optional, Dict
-import torch
+import importlib.util
+from typing import TYPE_CHECKING, List, Optional, Dict
 from loguru import logger
 
-try:
-    from peft import PeftModel, LoraConfig
-    PEFT_AVAILABLE = True
-except ImportError:
-    PEFT_AVAILABLE = False
+if TYPE_CHECKING:
+    import torch
+
+# torch and peft (which imports torch) load in the functions that merge
+# weights, so importing the hub does not pay for them
+PEFT_AVAILABLE = importlib.util.find_spec("peft") is not None
+
+
+def _weighted_state_dict(
+    adapter_paths: List[str],
+    weights: List[float]
+) -> Dict[str, "torch.Tensor"]:
+    """
+    Sum w_i * theta_i over adapter state dicts, accumulating in place.
+    
+    Adapters are loaded one at a time and folded into a single float32
+    accumulator per tensor, so peak memory is one adapter plus the result.
+    """
+    import torch
+    from peft.utils import load_peft_weights
+    
+    merged: Dict[str, torch.Tensor] = {}
+    for path, weight in zip(adapter_paths, weights):
+        state = load_peft_weights(path, device="cpu")
+        for key, value in state.items():
+            acc = merged.get(key)
+            if acc is None:
+                merged[key] = value.to(torch.float32).mul_(weight)
+            else:
+                acc.add_(value, alpha=weight)
+        del state
+    return merged
 
 
 class ModelSoup:
@@ -46,23 +73,25 @@ class ModelSoup:
         
         The Democracy Method: Every contributor gets equal vote.
         """
+        if not adapter_paths:
+            raise ValueError("linear_merge needs at least one adapter")
         if weights is None:
             weights = [1.0 / len(adapter_paths)] * len(adapter_paths)
+        elif len(weights) != len(adapter_paths):
+            raise ValueError("weights must have one entry per adapter")
         
         logger.info(f"⚗️ Linear merging {len(adapter_paths)} adapters...")
         
-        # TODO: Actual implementation using PEFT
-        # merged_state_dict = {}
-        # for adapter_path, weight in zip(adapter_paths, weights):
-        #     adapter = PeftModel.from_pretrained(self.base_model, adapter_path)
-        #     for key, value in adapter.state_dict().items():
-        #         if key not in merged_state_dict:
-        #             merged_state_dict[key] = weight * value
-        #         else:
-        #             merged_state_dict[key] += weight * value
+        # Per-tensor FedAvg over the LoRA factors. The merged adapter keeps
+        # the contributors' rank, so it loads with the same LoraConfig.
+        merged_state_dict = _weighted_state_dict(adapter_paths, weights)
+        
+        from peft import PeftModel, set_peft_model_state_dict
+        model = PeftModel.from_pretrained(self.base_model, adapter_paths[0])
+        set_peft_model_state_dict(model, merged_state_dict)
         
         logger.info("✅ Linear merge complete")
-        return self.base_model
+        return model
     
     def ties_merge(
         self,
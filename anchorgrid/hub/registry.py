@@ -14,10 +14,14 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
 from loguru import logger
 
+from anchorgrid.utils.lazy_import import lazy_import
+
+# Loaded on first use (~seconds of import time otherwise)
+torch = lazy_import("torch")
+transformers = lazy_import("transformers")
+
 try:
     from peft import PeftModel, get_peft_model, LoraConfig
     PEFT_AVAILABLE = True
@@ -161,7 +165,7 @@ class AnchorGridHub:
             weights = [1.0 / len(adapter_list)] * len(adapter_list)
         
         # Load base model
-        base_model = AutoModelForCausalLM.from_pretrained(
+        base_model = transformers.AutoModelForCausalLM.from_pretrained(
             self.base_model_id,
             torch_dtype=torch.float16,
             device_map="auto",
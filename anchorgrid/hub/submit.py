@@ -55,12 +55,15 @@ def prepare_submission(
             return None
     
     # 2. Verify AnchorGrid compatibility
+    # v1 = attention-only LoRA, v2 = attention + MLP. Merges never mix versions.
+    adapter_version = 1
     metadata_path = adapter_path / "anchorgrid_metadata.json"
     if metadata_path.exists():
         with open(metadata_path) as f:
             meta = json.load(f)
             if not meta.get("anchorgrid_compatible"):
                 logger.warning("⚠️  Adapter may not be compatible with AnchorGrid Hub")
+            adapter_version = meta.get("adapter_version", 1)
     
     # 3. Create metadata
     metadata = {
@@ -69,6 +72,7 @@ def prepare_submission(
         "dataset_description": dataset_desc,
         "base_model": "Mistral-7B-v0.1",
         "lora_config": {"r": 16, "alpha": 32},  # Proof of Compatibility
+        "adapter_version": adapter_version,
         "version": "1.0",
         "anchorgrid_version": "0.2.0",
     }
@@ -4,6 +4,7 @@ Fine-tuned LLM for Financial Analysis
 Uses LoRA to fine-tune Mistral-7B on financial data.
 """
 
+import re
 from typing import Optional, Dict, List
 import torch
 from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
@@ -11,6 +12,60 @@ from peft import LoraConfig, get_peft_model, prepare_model_for_kbit_training
 from loguru import logger
 
 from anchorgrid.ml import PredictionModel, TrainingConfig
+from anchorgrid.ml.nf4_cache import load_quantized_model
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+# Signal extraction patterns (shared by the Hyperscan and `re` paths)
+_SIGNAL_ID = 1
+_CONFIDENCE_ID = 2
+_SIGNAL_PATTERN = rb"\b(BUY|SELL|HOLD)\b"
+_CONFIDENCE_PATTERN = rb"confidence[:\s]+[0-9]+(\.[0-9]+)?"
+
+_SIGNAL_RE = re.compile(_SIGNAL_PATTERN.decode(), re.IGNORECASE)
+_CONFIDENCE_RE = re.compile(_CONFIDENCE_PATTERN.decode(), re.IGNORECASE)
+_NUMBER_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+
+
+def _compile_signal_database():
+    """Compile the signal patterns into a Hyperscan database (once per process)"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[_SIGNAL_PATTERN, _CONFIDENCE_PATTERN],
+        ids=[_SIGNAL_ID, _CONFIDENCE_ID],
+        elements=2,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * 2,
+    )
+    return db
+
+
+_SIGNAL_DB = _compile_signal_database()
+
+
+def _scan_spans(text: bytes) -> Dict[int, tuple]:
+    """
+    Find the first (leftmost, longest) span for each pattern id.
+
+    Hyperscan reports every match end offset, so for a given start we keep
+    the widest end - that is what a greedy `re` match would return.
+    """
+    spans: Dict[int, tuple] = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        current = spans.get(pattern_id)
+        if current is None or start < current[0] or (start == current[0] and end > current[1]):
+            spans[pattern_id] = (start, end)
+
+    _SIGNAL_DB.scan(text, match_event_handler=on_match)
+    return spans
 
 
 class FinancialLLM(PredictionModel):
@@ -47,19 +102,25 @@ class FinancialLLM(PredictionModel):
             
         self.model = None
         self.tokenizer = None
+        self._compiled = False
         
     def load_base_model(self):
-        """Load the base model and tokenizer"""
+        """
+        Load the base model and tokenizer.
+        
+        With ANCHORGRID_NF4_CACHE=1 the NF4-quantized weights are saved after
+        the first load and reused afterwards, skipping the fp16 -> NF4
+        re-quantization that otherwise dominates cold start.
+        """
         logger.info(f"Loading base model: {self.model_id}")
         
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_id)
         self.tokenizer.pad_token = self.tokenizer.eos_token
         
-        self.model = AutoModelForCausalLM.from_pretrained(
+        self.model = load_quantized_model(
             self.model_id,
-            quantization_config=self.bnb_config,
-            device_map="auto",
-            trust_remote_code=True,
+            self.bnb_config,
+            use_cache=self.load_in_4bit,
         )
         
         logger.info("Base model loaded successfully")
@@ -108,9 +169,16 @@ class FinancialLLM(PredictionModel):
         # Build prompt
         prompt = self._build_prompt(features)
         
+        self._compile_for_inference()
+        
         # Generate
         inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
         
+        generate_kwargs = {}
+        if self._compiled:
+            # Fixed-shape KV cache so CUDA graphs can be captured and replayed
+            generate_kwargs["cache_implementation"] = "static"
+        
         with torch.no_grad():
             outputs = self.model.generate(
                 **inputs,
@@ -118,6 +186,7 @@ class FinancialLLM(PredictionModel):
                 temperature=0.7,
                 top_p=0.9,
                 do_sample=True,
+                **generate_kwargs,
             )
             
         response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
@@ -125,6 +194,31 @@ class FinancialLLM(PredictionModel):
         # Parse response
         return self._parse_response(response)
         
+    def _compile_for_inference(self):
+        """
+        Wrap the forward pass with torch.compile for fused kernels.
+        
+        Only on CUDA with torch >= 2.3, and never while training - the
+        compile + autograd + bitsandbytes combination is fragile there.
+        """
+        if self._compiled or self.model.training:
+            return
+        if not torch.cuda.is_available():
+            return
+        
+        major, minor = (int(part) for part in torch.__version__.split("+")[0].split(".")[:2])
+        if (major, minor) < (2, 3):
+            return
+        
+        logger.info("Compiling model forward pass (reduce-overhead)")
+        self.model.forward = torch.compile(
+            self.model.forward,
+            mode="reduce-overhead",
+            fullgraph=False,
+            dynamic=False,
+        )
+        self._compiled = True
+        
     def _build_prompt(self, features: Dict) -> str:
         """Build analysis prompt from features"""
         ticker = features.get("ticker", "UNKNOWN")
@@ -144,12 +238,51 @@ Provide trading recommendation:"""
         return prompt
         
     def _parse_response(self, response: str) -> Dict:
-        """Parse model response into structured output"""
-        # TODO: Implement proper parsing
+        """
+        Parse model response into structured output.
+
+        Extracts the first BUY/SELL/HOLD signal and a "confidence: x" value.
+        Uses the shared Hyperscan database when available, otherwise `re`.
+        Defaults to HOLD / 0.5 when the model omits either field.
+        """
+        signal = "HOLD"
+        confidence = 0.5
+        signal_text = None
+        confidence_text = None
+
+        if _SIGNAL_DB is not None:
+            raw = response.encode("utf-8", errors="ignore")
+            spans = _scan_spans(raw)
+            if _SIGNAL_ID in spans:
+                start, end = spans[_SIGNAL_ID]
+                signal_text = raw[start:end].decode()
+            if _CONFIDENCE_ID in spans:
+                start, end = spans[_CONFIDENCE_ID]
+                confidence_text = raw[start:end].decode()
+        else:
+            match = _SIGNAL_RE.search(response)
+            if match:
+                signal_text = match.group(1)
+            match = _CONFIDENCE_RE.search(response)
+            if match:
+                confidence_text = match.group(0)
+
+        if signal_text:
+            signal = signal_text.upper()
+
+        if confidence_text:
+            number = _NUMBER_RE.search(confidence_text)
+            if number:
+                value = float(number.group(0))
+                # Accept both 0.85 and 85(%) styles
+                if value > 1.0:
+                    value /= 100.0
+                confidence = min(max(value, 0.0), 1.0)
+
         return {
             "analysis": response,
-            "signal": "HOLD",  # Parse from response
-            "confidence": 0.5,
+            "signal": signal,
+            "confidence": confidence,
         }
 
 
@@ -0,0 +1,76 @@
+"""
+AnchorGrid ML - Pre-quantized (NF4) base model cache
+
+With ANCHORGRID_NF4_CACHE=1 the 4-bit weights are saved to
+~/.anchorgrid/models after the first load and reused afterwards, skipping
+the fp16 -> NF4 re-quantization that otherwise dominates cold start.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+NF4_CACHE_ENV = "ANCHORGRID_NF4_CACHE"
+
+
+def nf4_cache_dir(model_id: str) -> Path:
+    """Where the pre-quantized copy of a base model lives"""
+    return Path.home() / ".anchorgrid" / "models" / f"{model_id.replace('/', '--')}_nf4"
+
+
+def _save_atomically(model, cache_dir: Path):
+    """
+    Save into a temporary sibling directory and move it into place.
+
+    The cache directory only ever appears complete, so an interrupted or
+    failed save can never be mistaken for a valid cache.
+    """
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f"{cache_dir.name}.", suffix=".tmp", dir=cache_dir.parent))
+    try:
+        model.save_pretrained(str(tmp_dir), safe_serialization=True)
+        os.replace(tmp_dir, cache_dir)
+        logger.info(f"💾 Cached NF4 weights to {cache_dir}")
+    except Exception as e:
+        # The model is loaded either way; a missing cache only costs speed
+        # (also covers another process having filled cache_dir first)
+        logger.warning(f"Could not cache NF4 weights to {cache_dir}: {e}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def load_quantized_model(model_id: str, quantization_config, use_cache: bool = True):
+    """
+    Load a causal LM with the given quantization config, via the NF4 cache.
+
+    Args:
+        model_id: Hugging Face model id
+        quantization_config: BitsAndBytesConfig (or None)
+        use_cache: Allow the NF4 cache (still requires ANCHORGRID_NF4_CACHE=1)
+
+    Returns:
+        The loaded model
+    """
+    from transformers import AutoModelForCausalLM
+
+    cache_dir = nf4_cache_dir(model_id)
+    use_nf4_cache = use_cache and os.getenv(NF4_CACHE_ENV) == "1"
+    cached = use_nf4_cache and cache_dir.is_dir()
+
+    if cached:
+        logger.info(f"⚡ Using pre-quantized weights: {cache_dir}")
+
+    model = AutoModelForCausalLM.from_pretrained(
+        str(cache_dir) if cached else model_id,
+        quantization_config=quantization_config,
+        device_map="auto",
+        trust_remote_code=True,
+    )
+
+    if use_nf4_cache and not cached:
+        _save_atomically(model, cache_dir)
+
+    return model
@@ -5,12 +5,16 @@ Forces every contributor to use identical architecture settings (Rank 16, Alpha
 ensuring their "Lego brick" fits the "Lego castle."
 """
 
+import hashlib
 import os
 import torch
+from pathlib import Path
 from typing import Optional
-from datasets import load_dataset
+from datasets import load_dataset, load_from_disk
 from loguru import logger
 
+from anchorgrid.ml.nf4_cache import load_quantized_model
+
 try:
     from peft import LoraConfig, get_peft_model, prepare_model_for_kbit_training
     from transformers import (
@@ -39,7 +43,14 @@ class AnchorGridTrainer:
     LORA_R = 16
     LORA_ALPHA = 32
     LORA_DROPOUT = 0.05
-    TARGET_MODULES = ["q_proj", "k_proj", "v_proj", "o_proj"]
+    # Attention + MLP projections ("LoRA on all linear layers").
+    # v2 adapters are NOT mergeable with v1 (attention-only) adapters.
+    TARGET_MODULES = [
+        "q_proj", "k_proj", "v_proj", "o_proj",
+        "gate_proj", "up_proj", "down_proj",
+    ]
+    ADAPTER_VERSION = 2  # Bump whenever the Lego connector changes
+    MAX_SEQ_LENGTH = 2048
     
     def __init__(self, base_model_id: str = "mistralai/Mistral-7B-v0.1"):
         if not TRAINING_AVAILABLE:
@@ -61,6 +72,50 @@ class AnchorGridTrainer:
         
         logger.info(f"✅ AnchorGrid Trainer initialized with {base_model_id}")
     
+    def _load_base_model(self):
+        """
+        Load the 4-bit base model.
+        
+        With ANCHORGRID_NF4_CACHE=1 the quantized weights are saved once to
+        ~/.anchorgrid/models and reused, skipping re-quantization per run.
+        """
+        return load_quantized_model(self.base_model_id, self.bnb_config)
+    
+    def _load_tokenized_dataset(self, dataset_path: str):
+        """
+        Tokenize the JSON dataset once, in parallel, instead of per step.
+        
+        Expects {"text": "Question... Answer..."} rows. The result is saved
+        next to the dataset and reused until the source file changes; the
+        cache name carries the tokenizer and max length it was built with.
+        """
+        fingerprint = hashlib.sha256(
+            f"{self.tokenizer.name_or_path}|{type(self.tokenizer).__name__}"
+            f"|{len(self.tokenizer)}|{self.MAX_SEQ_LENGTH}".encode()
+        ).hexdigest()[:12]
+        cache_path = Path(f"{dataset_path}.{fingerprint}.tokenized")
+        
+        if cache_path.exists() and cache_path.stat().st_mtime >= Path(dataset_path).stat().st_mtime:
+            logger.info(f"📚 Loading Tokenized Dataset: {cache_path}")
+            return load_from_disk(str(cache_path))
+        
+        logger.info(f"📚 Loading Dataset: {dataset_path}")
+        dataset = load_dataset("json", data_files=dataset_path, split="train")
+        
+        tokenized = dataset.map(
+            lambda batch: self.tokenizer(
+                batch["text"],
+                truncation=True,
+                max_length=self.MAX_SEQ_LENGTH,
+            ),
+            batched=True,
+            num_proc=os.cpu_count(),
+            remove_columns=dataset.column_names,
+        )
+        tokenized.save_to_disk(str(cache_path))
+        
+        return tokenized
+    
     def train(
         self,
         dataset_path: str,
@@ -85,12 +140,7 @@ class AnchorGridTrainer:
         logger.info(f"📉 Loading Base Model: {self.base_model_id}")
         
         # 1. Load base model with 4-bit quantization
-        model = AutoModelForCausalLM.from_pretrained(
-            self.base_model_id,
-            quantization_config=self.bnb_config,
-            device_map="auto",
-            trust_remote_code=True,
-        )
+        model = self._load_base_model()
         model = prepare_model_for_kbit_training(model)
         
         # 2. ENFORCE STANDARD LORA CONFIG (The "Lego Connector")
@@ -107,9 +157,8 @@ class AnchorGridTrainer:
         model = get_peft_model(model, peft_config)
         model.print_trainable_parameters()
         
-        # 3. Load dataset
-        logger.info(f"📚 Loading Dataset: {dataset_path}")
-        dataset = load_dataset("json", data_files=dataset_path, split="train")
+        # 3. Load dataset (pre-tokenized across all cores, cached on disk)
+        dataset = self._load_tokenized_dataset(dataset_path)
         
         # 4. Training arguments
         args = TrainingArguments(
@@ -131,8 +180,8 @@ class AnchorGridTrainer:
             model=model,
             train_dataset=dataset,
             peft_config=peft_config,
-            dataset_text_field="text",  # Expects {"text": "Question... Answer..."}
-            max_seq_length=2048,
+            dataset_kwargs={"skip_prepare_dataset": True},  # Already tokenized
+            max_seq_length=self.MAX_SEQ_LENGTH,
             tokenizer=self.tokenizer,
             args=args,
         )
@@ -149,6 +198,7 @@ class AnchorGridTrainer:
             "lora_r": self.LORA_R,
             "lora_alpha": self.LORA_ALPHA,
             "target_modules": self.TARGET_MODULES,
+            "adapter_version": self.ADAPTER_VERSION,
             "anchorgrid_compatible": True,
         }
         
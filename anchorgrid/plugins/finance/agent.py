@@ -78,19 +78,16 @@ class FinanceAgent:
             print(f"📊 Calculating technical indicators...")
             
             # Get historical data for RSI calculation
-            history = yfinance_scraper.get_historical(ticker, period="3mo")
+            history = yfinance_scraper.get_historical(ticker, period="3mo", format="arrays")
             
             # Default neutral RSI if calculation fails
             rsi_val = 50.0
             signal = "NEUTRAL"
             
-            if history is not None and len(history) > 14:
+            if history is not None and len(history['close']) > 14:
                 try:
-                    # Extract closing prices
-                    closes = history['Close'].values
-                    
-                    # Convert to numpy array (type safety)
-                    closes = np.array(closes, dtype=float)
+                    # Closing prices arrive as a float64 array
+                    closes = history['close']
                     
                     # Calculate RSI
                     rsi_series = rsi(closes, period=14)
@@ -3,19 +3,37 @@ Finance Connectors - Data Sources for Financial Markets
 
 Connectors are the universal term for data sources.
 In Finance, we connect to: Yahoo Finance, SEC EDGAR, Federal Reserve, etc.
-"""
 
-from anchorgrid.plugins.finance.connectors.yahoo_scraper import yfinance_scraper
-from anchorgrid.plugins.finance.connectors.nasdaq_scraper import nasdaq_scraper
-from anchorgrid.plugins.finance.connectors.marketwatch_scraper import marketwatch_scraper
-from anchorgrid.plugins.finance.connectors.aggregator import multi_source_aggregator
+Scraper singletons are imported on first attribute access (PEP 562), so
+importing one connector does not load every other source's dependencies.
+"""
 
-from anchorgrid.plugins.finance.connectors.fred_scraper import fred_scraper
-from anchorgrid.plugins.finance.connectors.central_banks import central_bank_scraper
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from anchorgrid.plugins.finance.connectors.sec_scraper import sec_scraper
+if TYPE_CHECKING:
+    from anchorgrid.plugins.finance.connectors.yahoo_scraper import yfinance_scraper
+    from anchorgrid.plugins.finance.connectors.nasdaq_scraper import nasdaq_scraper
+    from anchorgrid.plugins.finance.connectors.marketwatch_scraper import marketwatch_scraper
+    from anchorgrid.plugins.finance.connectors.aggregator import multi_source_aggregator
+    from anchorgrid.plugins.finance.connectors.fred_scraper import fred_scraper
+    from anchorgrid.plugins.finance.connectors.central_banks import central_bank_scraper
+    from anchorgrid.plugins.finance.connectors.sec_scraper import sec_scraper
+    from anchorgrid.plugins.finance.connectors.news_rss import news_rss_scraper
 
-from anchorgrid.plugins.finance.connectors.news_rss import news_rss_scraper
+# public name -> submodule that defines it
+_LOOKUP = {
+    "yfinance_scraper": ".yahoo_scraper",
+    "nasdaq_scraper": ".nasdaq_scraper",
+    "marketwatch_scraper": ".marketwatch_scraper",
+    "multi_source_aggregator": ".aggregator",
+    "fred_scraper": ".fred_scraper",
+    "central_bank_scraper": ".central_banks",
+    "sec_scraper": ".sec_scraper",
+    "news_rss_scraper": ".news_rss",
+}
 
 __all__ = [
     # Market Data
@@ -31,3 +49,29 @@ __all__ = [
     # News
     "news_rss_scraper",
 ]
+
+
+class _ConnectorsModule(ModuleType):
+    # Importing a submodule binds it on the package; for nasdaq_scraper,
+    # fred_scraper and sec_scraper that would shadow the singleton of the
+    # same name, so leave those slots for __getattr__ to fill.
+    def __setattr__(self, name, value):
+        if name in _LOOKUP and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ConnectorsModule
+
+
+def __getattr__(name: str):
+    module = _LOOKUP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,6 +12,7 @@ Strategy:
 Result: "Near Real-Time" quotes (5-10s) with zero API costs.
 """
 
+import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from loguru import logger
@@ -53,12 +54,10 @@ class MultiSourceAggregator:
         """
         for scraper in self.scrapers:
             try:
-                if hasattr(scraper, 'get_quote'):
-                    # Sync scraper
-                    quote = scraper.get_quote(symbol)
-                    if quote:
-                        logger.debug(f"{symbol}: Got quote from {scraper.SOURCE_NAME}")
-                        return quote
+                quote = scraper.get_quote(symbol)
+                if quote:
+                    logger.debug(f"{symbol}: Got quote from {scraper.SOURCE_NAME}")
+                    return quote
                 
             except Exception as e:
                 logger.warning(f"{symbol}: {scraper.SOURCE_NAME} failed - {e}")
@@ -69,7 +68,10 @@ class MultiSourceAggregator:
     
     async def get_quote_async(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
-        Async version of get_quote for async scrapers.
+        Async version of get_quote.
+        
+        Runs the (blocking) sync path in a worker thread so async callers
+        don't stall the event loop, and only uses the enabled scrapers.
         
         Args:
             symbol: Stock symbol
@@ -77,24 +79,19 @@ class MultiSourceAggregator:
         Returns:
             Quote data or None
         """
-        # Try YFinance first (sync)
-        quote = yfinance_scraper.get_quote(symbol)
-        if quote:
-            return quote
+        return await asyncio.to_thread(self.get_quote, symbol)
+    
+    async def get_quote_async_safe(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch from the primary source only, off the event loop.
         
-        # Try async scrapers
-        for scraper in [nasdaq_scraper, marketwatch_scraper]:
-            try:
-                quote = await scraper.get_quote(symbol)
-                if quote:
-                    logger.debug(f"{symbol}: Got quote from {scraper.SOURCE_NAME}")
-                    return quote
-            except Exception as e:
-                logger.warning(f"{symbol}: {scraper.SOURCE_NAME} failed - {e}")
-                continue
+        Args:
+            symbol: Stock symbol
         
-        logger.error(f"{symbol}: All scrapers failed")
-        return None
+        Returns:
+            Quote data or None
+        """
+        return await yfinance_scraper.get_quote_async(symbol)
     
     def get_quotes_batch(self, symbols: list[str]) -> Dict[str, Dict[str, Any]]:
         """
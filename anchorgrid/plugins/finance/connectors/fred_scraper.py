@@ -133,6 +133,98 @@ class FREDScraper:
         Returns:
             Dict mapping series_id -> data
         """
+        results = await self.get_series_multi(series_ids, lookback_days)
+        
+        logger.info(f"Fetched {len(results)}/{len(series_ids)} FRED series")
+        return results
+    
+    async def get_series_multi(
+        self,
+        ids: List[str],
+        lookback_days: int = 365
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several series in ONE request via fredgraph.csv?id=A,B,C.
+        
+        FRED returns one DATE column plus one column per series, so N series
+        cost a single round trip and a single CSV parse. If FRED rejects the
+        combined request (HTTP 400 - usually one invalid ID) we fall back to
+        fetching each series on its own.
+        
+        Args:
+            ids: List of FRED series IDs or SERIES_MAP names
+            lookback_days: Days of historical data
+        
+        Returns:
+            Dict mapping requested id -> data (same shape as get_series)
+        """
+        if not ids:
+            return {}
+        
+        # Map common names to series IDs (keep caller's keys for the result)
+        resolved = {
+            sid: self.SERIES_MAP.get(sid.upper(), sid.upper())
+            for sid in ids
+        }
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=lookback_days)
+        
+        # De-duplicate while preserving order (e.g. CPI and INFLATION)
+        unique_ids = list(dict.fromkeys(resolved.values()))
+        url = (
+            f"{self.GRAPH_URL}?id={','.join(unique_ids)}"
+            f"&cosd={start_date.strftime('%Y-%m-%d')}"
+        )
+        
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                response = await client.get(url)
+                
+                if response.status_code == 400:
+                    logger.warning("FRED rejected combined request, fetching series individually")
+                    return await self._get_series_individually(ids, lookback_days)
+                
+                response.raise_for_status()
+            
+            # Parse CSV once for all series
+            from io import StringIO
+            df = pd.read_csv(StringIO(response.text))
+            
+            df['DATE'] = pd.to_datetime(df['DATE'])
+            df = df[df['DATE'] >= start_date]
+            
+            last_updated = datetime.now().isoformat()
+            results = {}
+            
+            for requested, series_id in resolved.items():
+                if series_id not in df.columns:
+                    logger.warning(f"FRED response missing column for {series_id}")
+                    continue
+                
+                # Mixed frequencies leave gaps in the combined frame
+                series_df = df[['DATE', series_id]].dropna(subset=[series_id])
+                
+                results[requested] = {
+                    "series_id": series_id,
+                    "name": series_id,  # FRED doesn't give name in CSV
+                    "data": series_df.to_dict(orient='records'),
+                    "source": self.SOURCE_NAME,
+                    "last_updated": last_updated,
+                }
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to fetch {','.join(unique_ids)} from FRED: {e}")
+            return {}
+    
+    async def _get_series_individually(
+        self,
+        series_ids: List[str],
+        lookback_days: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per-series fallback for get_series_multi"""
         results = {}
         
         for series_id in series_ids:
@@ -140,7 +232,6 @@ class FREDScraper:
             if data:
                 results[series_id] = data
         
-        logger.info(f"Fetched {len(results)}/{len(series_ids)} FRED series")
         return results
     
     async def get_latest_value(self, series_id: str) -> Optional[float]:
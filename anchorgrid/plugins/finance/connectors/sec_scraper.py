@@ -10,7 +10,8 @@ Uses SEC's public API and RSS feeds.
 Rate limit: 10 requests/second per SEC guidelines.
 """
 import httpx
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any, List, AsyncIterator
 from datetime import datetime, timedelta
 from loguru import logger
 import asyncio
@@ -31,6 +32,9 @@ class SECScraper:
     BASE_URL = "https://www.sec.gov"
     API_URL = "https://data.sec.gov"
     
+    # Filing downloads are streamed in chunks of this size
+    CHUNK_SIZE = 64 * 1024
+    
     # Filing types
     FILING_TYPES = {
         "10-K": "Annual Report",
@@ -109,8 +113,11 @@ class SECScraper:
             logger.warning(f"No CIK found for {ticker}")
             return []
         
+        # Normalize once per call rather than per filing
+        cik_padded = cik.zfill(10)
+        
         # SEC submissions endpoint
-        url = f"{self.API_URL}/submissions/CIK{cik.zfill(10)}.json"
+        url = f"{self.API_URL}/submissions/CIK{cik_padded}.json"
         
         try:
             async with self.rate_limiter:
@@ -127,15 +134,21 @@ class SECScraper:
             dates = recent_filings.get('filingDate', [])
             accessions = recent_filings.get('accessionNumber', [])
             
+            ticker_upper = ticker.upper()
+            
             for i, form in enumerate(forms):
                 if form == filing_type and len(filings) < count:
+                    accession = accessions[i]
+                    accession_clean = accession.replace('-', '')
                     filings.append({
-                        "ticker": ticker.upper(),
+                        "ticker": ticker_upper,
                         "cik": cik,
+                        "cik_padded": cik_padded,
                         "filing_type": form,
                         "filing_date": dates[i],
-                        "accession_number": accessions[i],
-                        "url": f"{self.BASE_URL}/Archives/edgar/data/{cik}/{accessions[i].replace('-', '')}/{accessions[i]}.txt",
+                        "accession_number": accession,
+                        "accession_clean": accession_clean,
+                        "url": self._filing_url(cik, accession, accession_clean),
                         "source": self.SOURCE_NAME,
                     })
             
@@ -146,18 +159,35 @@ class SECScraper:
             logger.error(f"Failed to get filings for {ticker}: {e}")
             return []
     
-    async def download_filing(self, accession_number: str, cik: str) -> Optional[str]:
+    def _filing_url(
+        self,
+        cik: str,
+        accession_number: str,
+        accession_clean: Optional[str] = None
+    ) -> str:
+        """Build the EDGAR archive URL, reusing a pre-normalized accession if given"""
+        if accession_clean is None:
+            accession_clean = accession_number.replace('-', '')
+        return f"{self.BASE_URL}/Archives/edgar/data/{cik}/{accession_clean}/{accession_number}.txt"
+    
+    async def download_filing(
+        self,
+        accession_number: str,
+        cik: str,
+        accession_clean: Optional[str] = None
+    ) -> Optional[str]:
         """
         Download filing content.
         
         Args:
             accession_number: SEC accession number
             cik: Company CIK
+            accession_clean: Accession without dashes (from get_filings)
         
         Returns:
             Filing text content or None
         """
-        url = f"{self.BASE_URL}/Archives/edgar/data/{cik}/{accession_number.replace('-', '')}/{accession_number}.txt"
+        url = self._filing_url(cik, accession_number, accession_clean)
         
         try:
             async with self.rate_limiter:
@@ -171,6 +201,69 @@ class SECScraper:
         except Exception as e:
             logger.error(f"Failed to download filing {accession_number}: {e}")
             return None
+    
+    async def iter_filing_chunks(
+        self,
+        accession_number: str,
+        cik: str,
+        accession_clean: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream filing content without materializing it in memory.
+        
+        Full-submission 10-K files can be tens of MB; this yields decoded
+        (gzip is handled by httpx) byte chunks of CHUNK_SIZE instead.
+        
+        Args:
+            accession_number: SEC accession number
+            cik: Company CIK
+            accession_clean: Accession without dashes (from get_filings)
+        
+        Yields:
+            Raw filing bytes
+        """
+        url = self._filing_url(cik, accession_number, accession_clean)
+        
+        async with self.rate_limiter:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                async with client.stream("GET", url, headers=self.headers) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                        yield chunk
+    
+    async def download_filing_to(
+        self,
+        accession_number: str,
+        cik: str,
+        path: Path,
+        accession_clean: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Stream filing content straight to disk.
+        
+        Args:
+            accession_number: SEC accession number
+            cik: Company CIK
+            path: Destination file
+            accession_clean: Accession without dashes (from get_filings)
+        
+        Returns:
+            Path written or None
+        """
+        path = Path(path)
+        
+        try:
+            with open(path, "wb") as f:
+                async for chunk in self.iter_filing_chunks(accession_number, cik, accession_clean):
+                    f.write(chunk)
+            
+            logger.info(f"Downloaded filing {accession_number} to {path}")
+            return path
+            
+        except Exception as e:
+            logger.error(f"Failed to download filing {accession_number}: {e}")
+            path.unlink(missing_ok=True)
+            return None
 
 
 # Singleton instance
@@ -10,19 +10,42 @@ Features:
 - No rate limits (yfinance handles this)
 - Reliable (used by thousands of quant traders)
 """
+import asyncio
+import httpx
+import orjson
 import yfinance as yf
+import numpy as np
+import pandas as pd
 from typing import Optional, Dict, Any
 from datetime import datetime
 from loguru import logger
 
+from anchorgrid.core.cache import TTLCache
+
+
+# Intraday quotes are considered fresh for 15 seconds
+_QUOTE_CACHE = TTLCache(maxsize=4096, ttl=15)
+
 
 class YFinanceScraper:
     """Primary scraper using yfinance library"""
     
     SOURCE_NAME = "yfinance"
     
+    # Yahoo truncates/rejects larger multi-symbol downloads
+    BATCH_CHUNK_SIZE = 10
+    MAX_CONCURRENT_CHUNKS = 8
+    MAX_CONCURRENT_QUOTES = 10  # Single-symbol fallback requests in flight
+    
+    # Direct JSON quote endpoint (max 20 symbols per request)
+    SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+    SPARK_CHUNK_SIZE = 20
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    
     def __init__(self):
-        logger.info(f"Initialized {self.SOURCE_NAME} scraper")
+        self._http_client = None
+        self._http_client_loop = None  # Event loop the client is bound to
+        logger.info("Initialized {} scraper", self.SOURCE_NAME)
     
     def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -34,6 +57,10 @@ class YFinanceScraper:
         Returns:
             Quote data dict or None if failed
         """
+        cached = _QUOTE_CACHE.get(symbol)
+        if cached is not None:
+            return dict(cached)  # Callers may mutate their copy
+        
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
@@ -55,20 +82,28 @@ class YFinanceScraper:
             
             # Validate we got a price
             if quote["price"] is None:
-                logger.warning(f"{symbol}: No price data from yfinance")
+                logger.warning("{}: No price data from yfinance", symbol)
                 return None
             
-            logger.debug(f"{symbol}: ${quote['price']:.2f} from {self.SOURCE_NAME}")
+            logger.debug("{}: ${:.2f} from {}", symbol, quote["price"], self.SOURCE_NAME)
+            _QUOTE_CACHE.set(symbol, dict(quote))
             return quote
             
         except Exception as e:
-            logger.error(f"{symbol}: yfinance failed - {e}")
+            logger.error("{}: yfinance failed - {}", symbol, e)
             return None
     
+    async def get_quote_async(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """get_quote in a worker thread so the event loop keeps running"""
+        return await asyncio.to_thread(self.get_quote, symbol)
+    
     def get_quotes_batch(self, symbols: list[str]) -> Dict[str, Dict[str, Any]]:
         """
         Fetch quotes for multiple symbols at once (faster).
         
+        One yf.download call covers every symbol; individual get_quote
+        requests are only made for symbols missing from the batch result.
+        
         Args:
             symbols: List of symbols
         
@@ -78,39 +113,325 @@ class YFinanceScraper:
         results = {}
         
         try:
-            # yfinance supports batch download
+            # yfinance supports batch download (5d so the previous close is included)
             symbols_str = " ".join(symbols)
             data = yf.download(
                 symbols_str,
-                period="1d",
+                period="5d",
                 progress=False,
-                show_errors=False
+                group_by="ticker",
             )
             
-            # Parse results
+            # Parse results straight from the batch frame
+            missing = []
             for symbol in symbols:
+                quote = self._quote_from_frame(symbol, data)
+                if quote:
+                    results[symbol] = quote
+                else:
+                    missing.append(symbol)
+            
+            for symbol in missing:
                 quote = self.get_quote(symbol)
                 if quote:
                     results[symbol] = quote
             
-            logger.info(f"Fetched {len(results)}/{len(symbols)} quotes via batch")
+            logger.info("Fetched {}/{} quotes via batch", len(results), len(symbols))
             return results
             
         except Exception as e:
-            logger.error(f"Batch fetch failed: {e}, falling back to individual")
+            logger.error("Batch fetch failed: {}, falling back to individual", e)
             # Fallback to individual fetches
+            failed = 0
             for symbol in symbols:
                 quote = self.get_quote(symbol)
                 if quote:
                     results[symbol] = quote
+                else:
+                    failed += 1
             
+            if failed:
+                logger.warning("Individual fallback failed for {}/{} symbols", failed, len(symbols))
             return results
     
+    async def get_quotes_batch_async(self, symbols: list[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch quotes for many symbols concurrently.
+        
+        1. Yahoo's spark endpoint (plain JSON, SPARK_CHUNK_SIZE per request)
+        2. yf.download in chunks for symbols spark returned nothing for
+        3. Single-symbol get_quote for anything still missing
+        
+        Args:
+            symbols: List of symbols
+        
+        Returns:
+            Dict mapping symbol -> quote data
+        """
+        results = await self._spark_batch(symbols)
+        
+        remaining = [symbol for symbol in symbols if symbol not in results]
+        if remaining:
+            results.update(await self._download_batch_async(remaining))
+        
+        logger.info("Fetched {}/{} quotes via async batch", len(results), len(symbols))
+        return results
+    
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled client for direct Yahoo requests"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_client is None
+            or self._http_client.is_closed
+            or self._http_client_loop is not loop
+        ):
+            # Pooled connections belong to the loop that opened them; a client
+            # left over from another (likely finished) loop is abandoned
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                headers={"User-Agent": self.USER_AGENT},
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+            self._http_client_loop = loop
+        return self._http_client
+    
+    async def close(self):
+        """Close the HTTP client"""
+        if self._http_client:
+            if self._http_client_loop is asyncio.get_running_loop():
+                await self._http_client.aclose()
+            self._http_client = None
+            self._http_client_loop = None
+    
+    async def _spark_batch(self, symbols: list[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Quote symbols via /v8/finance/spark (1d range, 1m closes).
+        
+        Much lighter than yf.download: one small JSON document per chunk,
+        no DataFrame. Open/high/low are taken from the intraday closes and
+        volume is not provided. Symbols Yahoo returns null for are omitted.
+        """
+        client = await self._get_http_client()
+        chunks = [
+            symbols[i:i + self.SPARK_CHUNK_SIZE]
+            for i in range(0, len(symbols), self.SPARK_CHUNK_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
+        
+        async def fetch(chunk: list[str]):
+            async with semaphore:
+                resp = await client.get(
+                    self.SPARK_URL,
+                    params={
+                        "symbols": ",".join(chunk),
+                        "range": "1d",
+                        "interval": "1m",
+                        "indicators": "close",
+                    },
+                )
+                resp.raise_for_status()
+                return orjson.loads(resp.content)
+        
+        payloads = await asyncio.gather(
+            *(fetch(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for payload in payloads:
+            if isinstance(payload, Exception):
+                logger.warning("Spark request failed: {}", payload)
+                continue
+            
+            for symbol, series in self._iter_spark_series(payload):
+                quote = self._quote_from_spark(symbol, series)
+                if quote:
+                    results[symbol] = quote
+        
+        return results
+    
+    @staticmethod
+    def _iter_spark_series(payload: dict):
+        """Yield (symbol, series) from either spark response layout"""
+        if "spark" in payload:
+            # {"spark": {"result": [{"symbol": ..., "response": [{meta, indicators}]}]}}
+            for item in (payload["spark"].get("result") or []):
+                response = item.get("response") or []
+                if not response:
+                    continue
+                meta = response[0].get("meta", {})
+                quotes = response[0].get("indicators", {}).get("quote") or [{}]
+                yield item.get("symbol"), {
+                    "close": quotes[0].get("close") or [],
+                    "previousClose": meta.get("previousClose") or meta.get("chartPreviousClose"),
+                    "regularMarketPrice": meta.get("regularMarketPrice"),
+                }
+        else:
+            # {"AAPL": {"close": [...], "previousClose": ..., ...}}
+            for symbol, series in payload.items():
+                if isinstance(series, dict):
+                    yield symbol, series
+    
+    def _quote_from_spark(self, symbol: str, series: dict) -> Optional[Dict[str, Any]]:
+        """
+        Build a quote dict from one spark series, or None if empty.
+        
+        Spark quotes are partial (no volume, OHLC from 1m closes), so they
+        are never written to the quote cache that get_quote serves from.
+        """
+        closes = [c for c in (series.get("close") or []) if c is not None]
+        price = series.get("regularMarketPrice") or (closes[-1] if closes else None)
+        if price is None:
+            return None
+        
+        previous_close = series.get("previousClose") or series.get("chartPreviousClose")
+        
+        change = None
+        change_percent = None
+        if previous_close:
+            change = price - previous_close
+            change_percent = change / previous_close * 100
+        
+        quote = {
+            "symbol": symbol,
+            "price": price,
+            "change": change,
+            "change_percent": change_percent,
+            "open": closes[0] if closes else None,
+            "high": max(closes) if closes else None,
+            "low": min(closes) if closes else None,
+            "previous_close": previous_close,
+            "volume": None,
+            "timestamp": datetime.now().isoformat(),
+            "source": self.SOURCE_NAME
+        }
+        return quote
+    
+    async def _download_batch_async(self, symbols: list[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Quote symbols via yf.download in concurrent chunks.
+        
+        Symbols are split into chunks of BATCH_CHUNK_SIZE, each downloaded in
+        a worker thread (at most MAX_CONCURRENT_CHUNKS at once), so wall
+        time is roughly the slowest chunk rather than the sum of all.
+        """
+        chunks = [
+            symbols[i:i + self.BATCH_CHUNK_SIZE]
+            for i in range(0, len(symbols), self.BATCH_CHUNK_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
+        
+        async def download(chunk: list[str]):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    yf.download,
+                    " ".join(chunk),
+                    period="5d",
+                    progress=False,
+                    group_by="ticker",
+                    threads=False,
+                )
+        
+        frames = await asyncio.gather(
+            *(download(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        results = {}
+        missing = []
+        
+        for chunk, data in zip(chunks, frames):
+            if isinstance(data, Exception):
+                logger.error("Batch chunk failed: {}, falling back to individual", data)
+                missing.extend(chunk)
+                continue
+            
+            for symbol in chunk:
+                quote = self._quote_from_frame(symbol, data)
+                if quote:
+                    results[symbol] = quote
+                else:
+                    missing.append(symbol)
+        
+        if missing:
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUOTES)
+            
+            async def fetch_one(symbol: str):
+                async with semaphore:
+                    return await self.get_quote_async(symbol)
+            
+            quotes = await asyncio.gather(
+                *(fetch_one(symbol) for symbol in missing),
+                return_exceptions=True
+            )
+            for symbol, quote in zip(missing, quotes):
+                if quote and not isinstance(quote, Exception):
+                    results[symbol] = quote
+        
+        return results
+    
+    def _quote_from_frame(self, symbol: str, data) -> Optional[Dict[str, Any]]:
+        """
+        Build a quote dict from a yf.download(group_by="ticker") frame.
+        
+        Returns None if the symbol has no usable rows.
+        """
+        if data is None or data.empty:
+            return None
+        
+        try:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    return None
+                frame = data[symbol]
+            else:
+                frame = data
+            
+            frame = frame.dropna(subset=["Close"])
+        except KeyError:
+            return None
+        
+        if frame.empty:
+            return None
+        
+        last = frame.iloc[-1]
+        price = float(last["Close"])
+        previous_close = float(frame["Close"].iloc[-2]) if len(frame) > 1 else None
+        
+        change = None
+        change_percent = None
+        if previous_close:
+            change = price - previous_close
+            change_percent = change / previous_close * 100
+        
+        quote = {
+            "symbol": symbol,
+            "price": price,
+            "change": change,
+            "change_percent": change_percent,
+            "open": float(last["Open"]),
+            "high": float(last["High"]),
+            "low": float(last["Low"]),
+            "previous_close": previous_close,
+            "volume": int(last["Volume"]) if pd.notna(last["Volume"]) else None,
+            "timestamp": datetime.now().isoformat(),
+            "source": self.SOURCE_NAME
+        }
+        _QUOTE_CACHE.set(symbol, dict(quote))
+        return quote
+    
+    @staticmethod
+    def cache_clear():
+        """Drop all cached quotes"""
+        _QUOTE_CACHE.clear()
+    
     def get_historical(
         self,
         symbol: str,
         period: str = "1mo",
-        interval: str = "1d"
+        interval: str = "1d",
+        format: str = "records"
     ) -> Optional[Dict[str, Any]]:
         """
         Fetch historical OHLCV data.
@@ -119,6 +440,12 @@ class YFinanceScraper:
             symbol: Stock symbol
             period: Time period ("1d", "5d", "1mo", "3mo", "1y", "max")
             interval: Data interval ("1m", "5m", "1h", "1d", "1wk", "1mo")
+            format: "records" - list of row dicts under "data" (default)
+                    "columns" - one list per field (timestamp, open, high,
+                    low, close, volume; timestamp is UTC epoch nanoseconds),
+                    no per-row dicts
+                    "arrays" - same fields as float64/int64 numpy arrays
+                    (for numeric callers; not JSON-serializable)
         
         Returns:
             Historical data dict or None
@@ -128,24 +455,56 @@ class YFinanceScraper:
             hist = ticker.history(period=period, interval=interval)
             
             if hist.empty:
-                logger.warning(f"{symbol}: No historical data")
+                logger.warning("{}: No historical data", symbol)
                 return None
             
-            # Convert to dict format
-            data = {
-                "symbol": symbol,
-                "data": hist.reset_index().to_dict(orient="records"),
-                "source": self.SOURCE_NAME
-            }
+            if format == "arrays":
+                data = {
+                    "symbol": symbol,
+                    "timestamp": hist.index.asi8.copy(),
+                    "open": hist["Open"].to_numpy(dtype=np.float64),
+                    "high": hist["High"].to_numpy(dtype=np.float64),
+                    "low": hist["Low"].to_numpy(dtype=np.float64),
+                    "close": hist["Close"].to_numpy(dtype=np.float64),
+                    "volume": hist["Volume"].to_numpy(dtype=np.int64),
+                    "source": self.SOURCE_NAME
+                }
+            elif format == "columns":
+                # Columnar lists: no per-row dict boxing
+                data = {
+                    "symbol": symbol,
+                    "timestamp": hist.index.astype("int64").tolist(),
+                    "open": hist["Open"].tolist(),
+                    "high": hist["High"].tolist(),
+                    "low": hist["Low"].tolist(),
+                    "close": hist["Close"].tolist(),
+                    "volume": hist["Volume"].tolist(),
+                    "source": self.SOURCE_NAME
+                }
+            else:
+                data = {
+                    "symbol": symbol,
+                    "data": hist.reset_index().to_dict(orient="records"),
+                    "source": self.SOURCE_NAME
+                }
             
-            logger.debug(f"{symbol}: Got {len(hist)} historical bars")
+            logger.debug("{}: Got {} historical bars", symbol, len(hist))
             return data
             
         except Exception as e:
-            logger.error(f"{symbol}: Historical fetch failed - {e}")
+            logger.error("{}: Historical fetch failed - {}", symbol, e)
             return None
+    
+    async def get_historical_async(
+        self,
+        symbol: str,
+        period: str = "1mo",
+        interval: str = "1d",
+        format: str = "records"
+    ) -> Optional[Dict[str, Any]]:
+        """get_historical in a worker thread so the event loop keeps running"""
+        return await asyncio.to_thread(self.get_historical, symbol, period, interval, format)
 
 
 # Singleton instance
 yfinance_scraper = YFinanceScraper()
-
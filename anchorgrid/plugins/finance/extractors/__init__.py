@@ -6,31 +6,37 @@ In Finance, we extract: RSI, MACD, Bollinger Bands, ATR, etc.
 """
 
 from anchorgrid.plugins.finance.extractors.indicators import (
-    sma, ema, rsi, macd, bollinger_bands, atr, vwap, obv
+    sma, ema, ema_last, rsi, rsi_last, macd, bollinger_bands, atr, atr_last, vwap, obv
 )
 from anchorgrid.plugins.finance.extractors.regime import (
     VolatilityRegime,
     TrendRegime,
     RegimeState,
     detect_volatility_regime,
+    detect_volatility_regime_from_close,
     detect_trend_regime,
+    detect_trend_regime_from_values,
 )
 from anchorgrid.plugins.finance.extractors.composite import (
     Signal,
     CompositeScore,
     calculate_composite_score,
+    calculate_composite_scores,
 )
 from anchorgrid.plugins.finance.extractors.state import IndicatorState
 
 __all__ = [
     # Indicators
-    "sma", "ema", "rsi", "macd", "bollinger_bands", 
-    "atr", "vwap", "obv",
+    "sma", "ema", "ema_last", "rsi", "rsi_last", "macd", "bollinger_bands", 
+    "atr", "atr_last", "vwap", "obv",
     # Regime
     "VolatilityRegime", "TrendRegime", "RegimeState",
-    "detect_volatility_regime", "detect_trend_regime",
+    "detect_volatility_regime", "detect_volatility_regime_from_close",
+    "detect_trend_regime",
+    "detect_trend_regime_from_values",
     # Composite
     "Signal", "CompositeScore", "calculate_composite_score",
+    "calculate_composite_scores",
     # State
     "IndicatorState",
 ]
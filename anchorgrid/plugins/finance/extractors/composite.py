@@ -6,6 +6,8 @@ Combines multiple indicators into weighted signals.
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
+import numpy as np
+from numpy.typing import NDArray
 
 
 class Signal(str, Enum):
@@ -179,3 +181,83 @@ def calculate_composite_score(
         components=components,
     )
 
+
+# Signals in score order, indexable by an integer code array
+_SIGNALS = np.array(
+    [Signal.STRONG_BUY, Signal.BUY, Signal.HOLD, Signal.SELL, Signal.STRONG_SELL],
+    dtype=object,
+)
+
+
+def calculate_composite_scores(
+    price: NDArray[np.float64],
+    rsi: NDArray[np.float64],
+    macd_line: NDArray[np.float64],
+    macd_signal: NDArray[np.float64],
+    macd_histogram: NDArray[np.float64],
+    ema_20: NDArray[np.float64],
+    ema_50: NDArray[np.float64],
+    weights: Optional[dict[str, float]] = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.object_]]:
+    """
+    Vectorized calculate_composite_score over many tickers.
+    
+    NaN inputs mark a missing indicator (the scalar version's None).
+    
+    Returns:
+        Tuple of (score, confidence, signal) arrays
+    """
+    if weights is None:
+        weights = {"rsi": 0.25, "macd": 0.35, "ema": 0.40}
+    
+    with np.errstate(invalid="ignore"):
+        rsi_valid = ~np.isnan(rsi)
+        rsi_score = np.select(
+            [rsi < 30, rsi < 40, rsi > 70, rsi > 60],
+            [0.8, 0.4, -0.8, -0.4],
+            0.0,
+        )
+        
+        macd_valid = ~(np.isnan(macd_line) | np.isnan(macd_signal) | np.isnan(macd_histogram))
+        macd_score = np.select(
+            [
+                (macd_line > macd_signal) & (macd_histogram > 0),
+                (macd_line < macd_signal) & (macd_histogram < 0),
+            ],
+            [0.6, -0.6],
+            0.0,
+        )
+        
+        ema_valid = ~(np.isnan(ema_20) | np.isnan(ema_50))
+        ema_score = np.select(
+            [
+                (price > ema_20) & (ema_20 > ema_50),
+                (price < ema_20) & (ema_20 < ema_50),
+                price > ema_20,
+                price < ema_20,
+            ],
+            [0.7, -0.7, 0.3, -0.3],
+            0.0,
+        )
+    
+    components = (
+        (rsi_valid, rsi_score, weights["rsi"]),
+        (macd_valid, macd_score, weights["macd"]),
+        (ema_valid, ema_score, weights["ema"]),
+    )
+    total_score = sum(np.where(valid, score * weight, 0.0) for valid, score, weight in components)
+    total_weight = sum(np.where(valid, weight, 0.0) for valid, _, weight in components)
+    confidence_sum = sum(np.where(valid, np.abs(score), 0.0) for valid, score, _ in components)
+    n_valid = rsi_valid.astype(np.int64) + macd_valid + ema_valid
+    
+    score = np.divide(total_score, total_weight, out=np.zeros_like(total_score), where=total_weight > 0)
+    confidence = np.divide(confidence_sum, n_valid, out=np.zeros_like(confidence_sum), where=n_valid > 0)
+    
+    codes = np.select(
+        [score >= 0.6, score >= 0.2, score <= -0.6, score <= -0.2],
+        [0, 1, 4, 3],
+        2,
+    )
+    signal = _SIGNALS[codes]
+    
+    return score, confidence, signal
@@ -4,10 +4,230 @@ QuantForge AI Engine - Technical Indicators
 PURE MATH - No I/O, No DB access, Fully deterministic.
 
 All functions take numpy arrays and return numpy arrays.
+
+When numba is installed the hot loops (EMA, RSI, MACD, Bollinger) run as
+fused JIT kernels; otherwise the pure-NumPy implementations are used.
 """
+from functools import lru_cache
+from typing import Optional
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from numpy.typing import NDArray
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels stay importable without numba"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# =============================================================================
+# JIT KERNELS
+# =============================================================================
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _ema_kernel(prices, period):
+    n = len(prices)
+    alpha = 2.0 / (period + 1)
+    out = np.empty(n)
+    
+    value = prices[0]
+    out[0] = value
+    for i in range(1, n):
+        value = alpha * prices[i] + (1.0 - alpha) * value
+        out[i] = value
+    
+    out[:period - 1] = np.nan
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _rsi_kernel(prices, period):
+    # Gain/loss split, Wilder smoothing and RS -> RSI in one pass.
+    # Averages accumulate in float64; out takes the input dtype.
+    n = len(prices)
+    out = np.full(n, np.nan, prices.dtype)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(1, n):
+        delta = prices[i] - prices[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        
+        if i <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if i < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        rs = avg_gain / avg_loss if avg_loss != 0 else 100.0
+        out[i] = 100.0 - 100.0 / (1.0 + rs)
+    
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _macd_kernel(prices, fast, slow, signal):
+    # Fast EMA, slow EMA, MACD line and signal EMA as four running values
+    n = len(prices)
+    line = np.full(n, np.nan)
+    sig = np.full(n, np.nan)
+    hist = np.full(n, np.nan)
+    
+    a_fast = 2.0 / (fast + 1)
+    a_slow = 2.0 / (slow + 1)
+    a_sig = 2.0 / (signal + 1)
+    start = max(fast, slow) - 1
+    
+    ema_fast = prices[0]
+    ema_slow = prices[0]
+    ema_sig = 0.0
+    for i in range(n):
+        if i > 0:
+            ema_fast = a_fast * prices[i] + (1.0 - a_fast) * ema_fast
+            ema_slow = a_slow * prices[i] + (1.0 - a_slow) * ema_slow
+        if i < start:
+            continue
+        
+        value = ema_fast - ema_slow
+        line[i] = value
+        if i == start:
+            ema_sig = value
+        else:
+            ema_sig = a_sig * value + (1.0 - a_sig) * ema_sig
+        if i - start >= signal - 1:
+            sig[i] = ema_sig
+            hist[i] = value - ema_sig
+    
+    return line, sig, hist
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _bollinger_kernel(prices, period, std_dev):
+    n = len(prices)
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    
+    for i in range(period - 1, n):
+        mean = 0.0
+        for j in range(i - period + 1, i + 1):
+            mean += prices[j]
+        mean /= period
+        
+        var = 0.0
+        for j in range(i - period + 1, i + 1):
+            diff = prices[j] - mean
+            var += diff * diff
+        band = np.sqrt(var / period) * std_dev
+        
+        middle[i] = mean
+        upper[i] = mean + band
+        lower[i] = mean - band
+    
+    return upper, middle, lower
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _atr_last_kernel(high, low, close, period):
+    # True range and its EMA in one pass over the three arrays
+    alpha = 2.0 / (period + 1)
+    value = 0.0
+    for i in range(len(close)):
+        prev_close = close[i - 1] if i > 0 else close[0]
+        tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+        value = tr if i == 0 else alpha * tr + (1.0 - alpha) * value
+    return value
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _latest_batch_kernel(prices, out):
+    # One row per ticker; rows are left-padded with NaN for short histories.
+    # out columns: ema_20, ema_50, rsi_14, macd_line, macd_signal, macd_hist
+    out[:] = np.nan
+    a20 = 2.0 / 21.0
+    a50 = 2.0 / 51.0
+    a_fast = 2.0 / 13.0
+    a_slow = 2.0 / 27.0
+    a_sig = 2.0 / 10.0
+    
+    for t in prange(prices.shape[0]):
+        row = prices[t]
+        start = 0
+        while start < len(row) and np.isnan(row[start]):
+            start += 1
+        n = len(row) - start
+        if n == 0:
+            continue
+        
+        first = row[start]
+        ema20 = first
+        ema50 = first
+        ema_fast = first
+        ema_slow = first
+        ema_sig = 0.0
+        avg_gain = 0.0
+        avg_loss = 0.0
+        
+        for k in range(1, n):
+            price = row[start + k]
+            ema20 = a20 * price + (1.0 - a20) * ema20
+            ema50 = a50 * price + (1.0 - a50) * ema50
+            ema_fast = a_fast * price + (1.0 - a_fast) * ema_fast
+            ema_slow = a_slow * price + (1.0 - a_slow) * ema_slow
+            
+            if k >= 25:
+                line = ema_fast - ema_slow
+                if k == 25:
+                    ema_sig = line
+                else:
+                    ema_sig = a_sig * line + (1.0 - a_sig) * ema_sig
+            
+            delta = price - row[start + k - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if k <= 14:
+                avg_gain += gain
+                avg_loss += loss
+                if k == 14:
+                    avg_gain /= 14.0
+                    avg_loss /= 14.0
+            else:
+                avg_gain = (avg_gain * 13.0 + gain) / 14.0
+                avg_loss = (avg_loss * 13.0 + loss) / 14.0
+        
+        if n >= 20:
+            out[t, 0] = ema20
+        if n >= 50:
+            out[t, 1] = ema50
+        if n >= 15:
+            rs = avg_gain / avg_loss if avg_loss != 0 else 100.0
+            out[t, 2] = 100.0 - 100.0 / (1.0 + rs)
+        if n >= 26:
+            out[t, 3] = ema_fast - ema_slow
+        if n >= 34:
+            out[t, 4] = ema_sig
+            out[t, 5] = out[t, 3] - ema_sig
+
+
+# =============================================================================
+# INDICATORS
+# =============================================================================
+
 
 def sma(prices: NDArray[np.float64], period: int) -> NDArray[np.float64]:
     """
@@ -43,6 +263,9 @@ def ema(prices: NDArray[np.float64], period: int) -> NDArray[np.float64]:
     if len(prices) < period:
         return np.full_like(prices, np.nan)
     
+    if NUMBA_AVAILABLE:
+        return _ema_kernel(np.asarray(prices, dtype=np.float64), period)
+    
     alpha = 2 / (period + 1)
     result = np.zeros_like(prices)
     result[0] = prices[0]
@@ -55,6 +278,96 @@ def ema(prices: NDArray[np.float64], period: int) -> NDArray[np.float64]:
     return result
 
 
+@lru_cache(maxsize=64)
+def ema_weights(period: int, n: int) -> NDArray[np.float64]:
+    """Weights that reduce the EMA recurrence over n prices to one dot product"""
+    alpha = 2 / (period + 1)
+    weights = (1 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    weights[1:] *= alpha
+    weights.flags.writeable = False  # Shared between callers
+    return weights
+
+
+def ema_last(
+    prices: NDArray[np.float64],
+    period: int,
+    weights: Optional[NDArray[np.float64]] = None,
+) -> float:
+    """
+    Final value of the Exponential Moving Average
+    
+    Same result as ema(prices, period)[-1] without building the full
+    series: the recurrence seeded with prices[0] unrolls to w . prices.
+    
+    Args:
+        prices: Array of closing prices
+        period: Lookback period
+        weights: Precomputed ema_weights(period, len(prices)), if at hand
+        
+    Returns:
+        Latest EMA value (NaN during warmup)
+    """
+    n = len(prices)
+    if n < period or n == 0:
+        return float("nan")
+    if weights is None:
+        weights = ema_weights(period, n)
+    return float(weights @ prices)
+
+
+@lru_cache(maxsize=64)
+def wilder_weights(period: int, n: int) -> NDArray[np.float64]:
+    """
+    Weights that reduce Wilder smoothing over n prices to one dot product.
+    
+    weights[0] applies to the seed average of the first `period` changes,
+    weights[1:] to each later change.
+    """
+    steps = max(n - 1 - period, 0)
+    decay = (period - 1) / period
+    weights = np.empty(steps + 1, dtype=np.float64)
+    weights[0] = decay ** steps
+    weights[1:] = decay ** np.arange(steps - 1, -1, -1, dtype=np.float64) / period
+    weights.flags.writeable = False  # Shared between callers
+    return weights
+
+
+def rsi_last(
+    prices: NDArray[np.float64],
+    period: int = 14,
+    weights: Optional[NDArray[np.float64]] = None,
+) -> float:
+    """
+    Final value of the Relative Strength Index
+    
+    Same result as rsi(prices, period)[-1], with the Wilder recurrence
+    unrolled into dot products.
+    
+    Args:
+        prices: Array of closing prices
+        period: Lookback period (default 14)
+        weights: Precomputed wilder_weights(period, len(prices)), if at hand
+        
+    Returns:
+        Latest RSI value (NaN during warmup)
+    """
+    n = len(prices)
+    if n < period + 1:
+        return float("nan")
+    if weights is None:
+        weights = wilder_weights(period, n)
+    
+    deltas = np.diff(prices)
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+    
+    avg_gain = weights[0] * gains[:period].mean() + weights[1:] @ gains[period:]
+    avg_loss = weights[0] * losses[:period].mean() + weights[1:] @ losses[period:]
+    
+    rs = avg_gain / avg_loss if avg_loss != 0 else 100
+    return float(100 - (100 / (1 + rs)))
+
+
 def rsi(prices: NDArray[np.float64], period: int = 14) -> NDArray[np.float64]:
     """
     Relative Strength Index
@@ -64,11 +377,18 @@ def rsi(prices: NDArray[np.float64], period: int = 14) -> NDArray[np.float64]:
         period: Lookback period (default 14)
         
     Returns:
-        Array of RSI values (0-100)
+        Array of RSI values (0-100); float32 for float32 input, else float64
     """
     if len(prices) < period + 1:
         return np.full_like(prices, np.nan)
     
+    # float32 series keep their dtype (half the memory traffic on long
+    # series); everything else is computed in float64
+    dtype = np.float32 if getattr(prices, "dtype", None) == np.float32 else np.float64
+    
+    if NUMBA_AVAILABLE:
+        return _rsi_kernel(np.asarray(prices, dtype=dtype), period)
+    
     # Calculate price changes
     deltas = np.diff(prices)
     
@@ -94,7 +414,7 @@ def rsi(prices: NDArray[np.float64], period: int = 14) -> NDArray[np.float64]:
     rsi_values = 100 - (100 / (1 + rs))
     
     # Pad result to match input length
-    result = np.full(len(prices), np.nan)
+    result = np.full(len(prices), np.nan, dtype=dtype)
     result[period:] = rsi_values[period-1:]
     
     return result
@@ -118,11 +438,19 @@ def macd(
     Returns:
         Tuple of (macd_line, signal_line, histogram)
     """
+    if NUMBA_AVAILABLE and len(prices) > 0:
+        return _macd_kernel(np.asarray(prices, dtype=np.float64), fast, slow, signal)
+    
     ema_fast = ema(prices, fast)
     ema_slow = ema(prices, slow)
     
     macd_line = ema_fast - ema_slow
-    signal_line = ema(macd_line, signal)
+    
+    # Signal EMA is seeded from the first defined MACD value
+    start = max(fast, slow) - 1
+    signal_line = np.full_like(macd_line, np.nan)
+    if len(macd_line) > start:
+        signal_line[start:] = ema(macd_line[start:], signal)
     histogram = macd_line - signal_line
     
     return macd_line, signal_line, histogram
@@ -144,12 +472,15 @@ def bollinger_bands(
     Returns:
         Tuple of (upper_band, middle_band, lower_band)
     """
+    if NUMBA_AVAILABLE:
+        return _bollinger_kernel(np.asarray(prices, dtype=np.float64), period, std_dev)
+    
     middle = sma(prices, period)
     
-    # Calculate rolling standard deviation
+    # Rolling standard deviation over strided window views (no per-window slicing)
     std = np.full_like(prices, np.nan)
-    for i in range(period - 1, len(prices)):
-        std[i] = np.std(prices[i - period + 1:i + 1])
+    if len(prices) >= period:
+        std[period - 1:] = sliding_window_view(prices, period).std(axis=1)
     
     upper = middle + (std * std_dev)
     lower = middle - (std * std_dev)
@@ -190,6 +521,34 @@ def atr(
     return ema(true_range, period)
 
 
+def atr_last(
+    high: NDArray[np.float64],
+    low: NDArray[np.float64],
+    close: NDArray[np.float64],
+    period: int = 14,
+) -> float:
+    """
+    Final value of the Average True Range
+    
+    Same result as atr(high, low, close, period)[-1]; with numba the true
+    range and its smoothing are fused into a single pass.
+    
+    Returns:
+        Latest ATR value (NaN during warmup)
+    """
+    n = len(close)
+    if n < 2 or n < period:
+        return float("nan")
+    if NUMBA_AVAILABLE:
+        return float(_atr_last_kernel(
+            np.asarray(high, dtype=np.float64),
+            np.asarray(low, dtype=np.float64),
+            np.asarray(close, dtype=np.float64),
+            period,
+        ))
+    return float(atr(high, low, close, period)[-1])
+
+
 def vwap(
     high: NDArray[np.float64],
     low: NDArray[np.float64],
@@ -246,3 +605,35 @@ def obv(
     signed_volume = direction * volume
     return np.cumsum(signed_volume)
 
+
+def latest_indicators_batch(prices: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Latest default-period indicator values for many tickers at once
+    
+    Args:
+        prices: (tickers, history) matrix of closing prices, oldest first,
+            left-padded with NaN for shorter histories
+        
+    Returns:
+        (tickers, 6) array of ema_20, ema_50, rsi_14, macd_line,
+        macd_signal, macd_hist (NaN during warmup)
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    out = np.empty((prices.shape[0], 6), dtype=np.float64)
+    
+    if NUMBA_AVAILABLE:
+        _latest_batch_kernel(prices, out)
+        return out
+    
+    for t, row in enumerate(prices):
+        row = row[~np.isnan(row)]
+        macd_line, macd_signal, macd_hist = macd(row) if len(row) else ([np.nan],) * 3
+        out[t] = (
+            ema_last(row, 20),
+            ema_last(row, 50),
+            rsi(row, 14)[-1] if len(row) else np.nan,
+            macd_line[-1],
+            macd_signal[-1],
+            macd_hist[-1],
+        )
+    return out
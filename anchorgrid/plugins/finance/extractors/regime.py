@@ -9,6 +9,8 @@ from typing import Optional
 import numpy as np
 from numpy.typing import NDArray
 
+from anchorgrid.plugins.finance.extractors.indicators import NUMBA_AVAILABLE, njit
+
 
 class VolatilityRegime(str, Enum):
     LOW = "low"
@@ -73,17 +75,131 @@ def detect_volatility_regime(
     # Calculate percentile
     percentile = (np.sum(np.array(rolling_vols) <= current_vol) / len(rolling_vols)) * 100
     
-    # Determine regime
+    return _classify_volatility(percentile, thresholds), percentile
+
+
+@njit(cache=True, nogil=True)
+def _pairwise_sum(a):
+    """Sum in np.add.reduce's (pairwise, 8-way unrolled) order"""
+    n = len(a)
+    if n < 8:
+        res = -0.0
+        for i in range(n):
+            res += a[i]
+        return res
+    if n <= 128:
+        r0, r1, r2, r3 = a[0], a[1], a[2], a[3]
+        r4, r5, r6, r7 = a[4], a[5], a[6], a[7]
+        i = 8
+        while i < n - n % 8:
+            r0 += a[i]
+            r1 += a[i + 1]
+            r2 += a[i + 2]
+            r3 += a[i + 3]
+            r4 += a[i + 4]
+            r5 += a[i + 5]
+            r6 += a[i + 6]
+            r7 += a[i + 7]
+            i += 8
+        res = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+        while i < n:
+            res += a[i]
+            i += 1
+        return res
+    n2 = n // 2
+    n2 -= n2 % 8
+    return _pairwise_sum(a[:n2]) + _pairwise_sum(a[n2:])
+
+
+@njit(cache=True, nogil=True)
+def _window_vol(window, dev):
+    """np.std(window) * np.sqrt(252) * 100, with the same two passes"""
+    n = len(window)
+    mean = _pairwise_sum(window) / n
+    for k in range(n):
+        d = window[k] - mean
+        dev[k] = d * d
+    return np.sqrt(_pairwise_sum(dev[:n]) / n) * np.sqrt(252.0) * 100.0
+
+
+@njit(cache=True, nogil=True)
+def _vol_percentile_kernel(returns, lookback):
+    """
+    Percentile of the latest rolling volatility among all rolling windows.
+    
+    Each window is reduced exactly as np.std does it, so windows whose
+    volatility ties the latest one compare the same way as in
+    detect_volatility_regime (running sums drift and break those ties).
+    """
+    m = len(returns)
+    dev = np.empty(lookback)
+    current = _window_vol(returns[m - lookback:], dev)
+    
+    count = 0
+    for i in range(lookback, m + 1):
+        if _window_vol(returns[i - lookback:i], dev) <= current:
+            count += 1
+    
+    return count / (m - lookback + 1) * 100.0
+
+
+def detect_volatility_regime_from_close(
+    close: NDArray[np.float64],
+    lookback: int = 20,
+    thresholds: Optional[dict] = None,
+    scratch: Optional[NDArray[np.float64]] = None,
+) -> tuple[VolatilityRegime, float]:
+    """
+    Detect volatility regime directly from closing prices.
+    
+    Same result as detect_volatility_regime(np.diff(np.log(close))), with
+    the log returns written into one reusable buffer and, with numba, the
+    rolling windows reduced in a single compiled loop.
+    
+    Args:
+        close: Array of closing prices
+        lookback: Period for rolling std
+        thresholds: Custom threshold dict
+        scratch: Optional float64 buffer of at least len(close), reused
+            for the log returns
+        
+    Returns:
+        Tuple of (regime, percentile)
+    """
+    n = len(close)
+    if scratch is None:
+        scratch = np.empty(n, dtype=np.float64)
+    log_buf = scratch[:n]
+    np.log(close, out=log_buf)
+    np.subtract(log_buf[1:], log_buf[:-1], out=log_buf[:-1])
+    returns = log_buf[:n - 1]
+    
+    if not NUMBA_AVAILABLE:
+        return detect_volatility_regime(returns, lookback, thresholds)
+    
+    if thresholds is None:
+        thresholds = {
+            "low": 25,
+            "normal": 75,
+            "high": 95,
+        }
+    
+    if len(returns) < lookback:
+        return VolatilityRegime.NORMAL, 50.0
+    
+    percentile = _vol_percentile_kernel(returns, lookback)
+    return _classify_volatility(percentile, thresholds), percentile
+
+
+def _classify_volatility(percentile: float, thresholds: dict) -> VolatilityRegime:
+    """Map a volatility percentile onto a regime"""
     if percentile <= thresholds["low"]:
-        regime = VolatilityRegime.LOW
+        return VolatilityRegime.LOW
     elif percentile <= thresholds["normal"]:
-        regime = VolatilityRegime.NORMAL
+        return VolatilityRegime.NORMAL
     elif percentile <= thresholds["high"]:
-        regime = VolatilityRegime.HIGH
-    else:
-        regime = VolatilityRegime.EXTREME
-    
-    return regime, percentile
+        return VolatilityRegime.HIGH
+    return VolatilityRegime.EXTREME
 
 
 def detect_trend_regime(
@@ -105,11 +221,25 @@ def detect_trend_regime(
     if len(prices) < 2:
         return TrendRegime.SIDEWAYS, 0.0
     
-    # Get latest values
-    price = prices[-1]
-    short = ema_short[-1]
-    long_ = ema_long[-1]
+    return detect_trend_regime_from_values(prices[-1], ema_short[-1], ema_long[-1])
+
+
+def detect_trend_regime_from_values(
+    price: float,
+    short: float,
+    long_: float,
+) -> tuple[TrendRegime, float]:
+    """
+    Detect trend regime from the latest price and EMA values.
     
+    Args:
+        price: Latest price
+        short: Latest short-term EMA (e.g., 20)
+        long_: Latest long-term EMA (e.g., 50)
+        
+    Returns:
+        Tuple of (regime, strength 0-1)
+    """
     # Handle NaN
     if np.isnan(short) or np.isnan(long_):
         return TrendRegime.SIDEWAYS, 0.0
@@ -7,6 +7,73 @@ No historical recompute required.
 from dataclasses import dataclass, field
 from typing import Optional
 import numpy as np
+from numpy.typing import NDArray
+
+from anchorgrid.plugins.finance.extractors.indicators import njit
+
+
+@njit(cache=True, nogil=True)
+def _update_batch_kernel(
+    prices,
+    ema_value,
+    ema_count,
+    ema_period,
+    rsi_period,
+    rsi_avg_gain,
+    rsi_avg_loss,
+    rsi_prev,
+    rsi_has_prev,
+    rsi_count,
+):
+    """
+    Advance all running indicator state over a block of prices.
+    
+    EMA slots: 0=ema_20, 1=ema_50, 2=macd fast, 3=macd slow, 4=macd signal.
+    ema_value/ema_count are updated in place; RSI scalars are returned.
+    """
+    alphas = 2.0 / (ema_period + 1.0)
+    
+    for price in prices:
+        # Plain EMAs and MACD legs
+        for k in range(4):
+            if ema_count[k] == 0:
+                ema_value[k] = price
+            else:
+                ema_value[k] = alphas[k] * price + (1.0 - alphas[k]) * ema_value[k]
+            ema_count[k] += 1
+        
+        # MACD signal only advances once both legs are out of warmup
+        if ema_count[2] >= ema_period[2] and ema_count[3] >= ema_period[3]:
+            line = ema_value[2] - ema_value[3]
+            if ema_count[4] == 0:
+                ema_value[4] = line
+            else:
+                ema_value[4] = alphas[4] * line + (1.0 - alphas[4]) * ema_value[4]
+            ema_count[4] += 1
+        
+        # RSI (sums during warmup, Wilder smoothing afterwards)
+        if not rsi_has_prev:
+            rsi_prev = price
+            rsi_has_prev = True
+            continue
+        
+        change = price - rsi_prev
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        rsi_prev = price
+        rsi_count += 1
+        
+        if rsi_count <= rsi_period:
+            rsi_avg_gain += gain
+            rsi_avg_loss += loss
+            if rsi_count == rsi_period:
+                rsi_avg_gain /= rsi_period
+                rsi_avg_loss /= rsi_period
+        else:
+            rsi_avg_gain = (rsi_avg_gain * (rsi_period - 1) + gain) / rsi_period
+            rsi_avg_loss = (rsi_avg_loss * (rsi_period - 1) + loss) / rsi_period
+    
+    return rsi_avg_gain, rsi_avg_loss, rsi_prev, rsi_has_prev, rsi_count
 
 
 @dataclass
@@ -37,17 +104,25 @@ class EMAState:
 
 @dataclass
 class RSIState:
-    """Incremental RSI state"""
+    """Incremental RSI state (avg_* hold running sums during warmup)"""
     period: int = 14
     avg_gain: float = 0.0
     avg_loss: float = 0.0
     prev_price: Optional[float] = None
     count: int = 0
-    gains_buffer: list = field(default_factory=list)
-    losses_buffer: list = field(default_factory=list)
+    
+    @property
+    def value(self) -> Optional[float]:
+        """Current RSI (None during warmup)"""
+        if self.count <= self.period:
+            return None
+        if self.avg_loss == 0:
+            return 100.0
+        rs = self.avg_gain / self.avg_loss
+        return 100 - (100 / (1 + rs))
     
     def update(self, price: float) -> Optional[float]:
-        """Update RSI with new price (O(1) after warmup)"""
+        """Update RSI with new price (O(1))"""
         if self.prev_price is None:
             self.prev_price = price
             return None
@@ -59,27 +134,21 @@ class RSIState:
         self.prev_price = price
         self.count += 1
         
-        # Warmup phase: collect first `period` changes
+        # Warmup phase: sum the first `period` changes
         if self.count <= self.period:
-            self.gains_buffer.append(gain)
-            self.losses_buffer.append(loss)
+            self.avg_gain += gain
+            self.avg_loss += loss
             
             if self.count == self.period:
-                self.avg_gain = sum(self.gains_buffer) / self.period
-                self.avg_loss = sum(self.losses_buffer) / self.period
-                self.gains_buffer.clear()
-                self.losses_buffer.clear()
+                self.avg_gain /= self.period
+                self.avg_loss /= self.period
             return None
         
         # Incremental update (O(1))
         self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
         self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
         
-        if self.avg_loss == 0:
-            return 100.0
-        
-        rs = self.avg_gain / self.avg_loss
-        return 100 - (100 / (1 + rs))
+        return self.value
 
 
 @dataclass
@@ -135,4 +204,61 @@ class IndicatorState:
             "rsi_14": self.rsi_14.update(price),
             "macd": self.macd.update(price),
         }
+    
+    def update_batch(self, prices: NDArray[np.float64]) -> dict:
+        """
+        Advance all indicators over a block of prices in one pass.
+        
+        Equivalent to calling update() per price, but runs as a single
+        (numba, GIL-free) loop. Use for backfills.
+        
+        Returns dict of indicator values after the last price.
+        """
+        emas = (self.ema_20, self.ema_50, self.macd.fast_ema,
+                self.macd.slow_ema, self.macd.signal_ema)
+        ema_value = np.array([e.value or 0.0 for e in emas], dtype=np.float64)
+        ema_count = np.array([e.count for e in emas], dtype=np.int64)
+        ema_period = np.array([e.period for e in emas], dtype=np.int64)
+        
+        rsi = self.rsi_14
+        (
+            rsi.avg_gain, rsi.avg_loss, prev_price, has_prev, rsi.count
+        ) = _update_batch_kernel(
+            np.ascontiguousarray(prices, dtype=np.float64),
+            ema_value,
+            ema_count,
+            ema_period,
+            rsi.period,
+            rsi.avg_gain,
+            rsi.avg_loss,
+            rsi.prev_price if rsi.prev_price is not None else 0.0,
+            rsi.prev_price is not None,
+            rsi.count,
+        )
+        rsi.prev_price = float(prev_price) if has_prev else None
+        
+        for e, value, count in zip(emas, ema_value, ema_count):
+            e.count = int(count)
+            e.value = float(value) if count else None
+        
+        return self.snapshot()
+    
+    def snapshot(self) -> dict:
+        """Current indicator values (same shape as update())"""
+        def ready(e: EMAState) -> Optional[float]:
+            return e.value if e.count >= e.period else None
+        
+        macd = None
+        fast, slow, signal = (ready(self.macd.fast_ema), ready(self.macd.slow_ema),
+                              ready(self.macd.signal_ema))
+        if fast is not None and slow is not None and signal is not None:
+            line = fast - slow
+            macd = (line, signal, line - signal)
+        
+        return {
+            "ema_20": ready(self.ema_20),
+            "ema_50": ready(self.ema_50),
+            "rsi_14": self.rsi_14.value,
+            "macd": macd,
+        }
 
@@ -6,9 +6,91 @@ Modular architecture ready for Quant-ai fine-tuned model integration.
 import asyncio
 import random
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
 from abc import ABC, abstractmethod
 
+from anchorgrid.core.cache import TTLCache
+from anchorgrid.core.config import settings
+
+
+# Static mock payloads per market mode (read-only; callers get a copy)
+_INTELLIGENCE: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "STOCKS": {
+        "regime": "NEUTRAL / ACCUMULATION",
+        "color": "#ffff00",  # Yellow
+        "summary": "Equity markets showing consolidation after recent earnings volatility. Focus on defensive sectors.",
+        "confidence": 72,
+        "indicators": (
+            ("✅ VIX Index", "14.2 (Stable)"),
+            ("⚠️ Yield Curve", "Inverted (Recession risk)"),
+            ("✅ Breadth", "58% Stocks > 50-day MA")
+        ),
+        "recommendation": "Maintain core equity exposure; hedge with high-dividend value stocks."
+    },
+    "CRYPTO": {
+        "regime": "ALTCOIN SEASON DETECTED",
+        "color": "#3fb950",  # Green
+        "summary": "BTC dominance dropping to 48% while Layer 1 protocols (SOL, AVAX) show massive institutional rotation.",
+        "confidence": 88,
+        "indicators": (
+            ("✅ BTC Dominance", "48% (Dropping)"),
+            ("✅ TVL Growth", "+12% in 24h"),
+            ("⚠️ Funding Rates", "Elevated (Caution)")
+        ),
+        "recommendation": "Rotate capital from BTC to high-beta Layer 1s; tight stop losses at $118 for SOL."
+    },
+    "FOREX": {
+        "regime": "RISK-OFF EQUILIBRIUM",
+        "color": "#ff4444",  # Red
+        "summary": "Dollar strength persisting as Fed maintains hawkish stance. Major pairs hitting key resistance levels.",
+        "confidence": 65,
+        "indicators": (
+            ("⚠️ DXY Strength", "104.5 (Breakout)"),
+            ("✅ Treasury Yields", "4.2% (Support)"),
+            ("⚠️ Sentiment", "Fear-driven flight to cash")
+        ),
+        "recommendation": "Short EUR/USD on retracement to 1.0920; target 1.0805."
+    },
+    "COMMODITIES": {
+        "regime": "SUPPLY-SIDE SQUEEZE",
+        "color": "#ff8800",  # Orange
+        "summary": "Geopolitical tensions in MEA driving Crude Oil premiums. Gold seeing safe-haven inflow despite USD strength.",
+        "confidence": 81,
+        "indicators": (
+            ("✅ Geopolitical Risk", "High (Premium +$5)"),
+            ("⚠️ Inventories", "3% below average"),
+            ("✅ Gold Correlation", "Decoupling from USD")
+        ),
+        "recommendation": "Long Gold on pullbacks to $2,015; target $2,100 high."
+    },
+    "INDICES": {
+        "regime": "TECH LEADERSHIP CONCENTRATION",
+        "color": "#58a6ff",  # Blue
+        "summary": "S&P 500 driven largely by 'Magnificent 7' performance. Small caps lagging, showing market internal weakness.",
+        "confidence": 75,
+        "indicators": (
+            ("✅ NDX/SPX Ratio", "All-time High"),
+            ("⚠️ Advance-Decline", "Diverging (Bearish)"),
+            ("✅ Put/Call Ratio", "0.85 (Bullish bias)")
+        ),
+        "recommendation": "Overweight NASDAQ; Underweight Russell 2000 until breadth improves."
+    },
+    "OPTIONS": {
+        "regime": "VOLATILITY COMPRESSION",
+        "color": "#FF00FF",  # Magenta
+        "summary": "Implied volatility trading at 12-month lows. Theta decay favoring sellers; cheap insurance for long-term holders.",
+        "confidence": 90,
+        "indicators": (
+            ("✅ IV Rank", "12% (Extreme Low)"),
+            ("✅ Skew", "Skewing to Puts (Hedging)"),
+            ("⚠️ Gamma Exposure", "Positive (Market pinning)")
+        ),
+        "recommendation": "Buy LEAPS on Tech sector; Sell weekly iron condors on low-vol indices."
+    }
+})
+
+
 class IntelligenceProvider(ABC):
     """Base interface for market intelligence providers."""
     
@@ -21,86 +103,11 @@ class MockIntelligenceProvider(IntelligenceProvider):
     """Mock provider for cinematic UI testing and development."""
     
     async def get_insight(self, mode: str) -> Dict[str, Any]:
-        await asyncio.sleep(0.8)  # Thinking delay
+        if settings.MOCK_AGENT_DELAY:
+            await asyncio.sleep(settings.MOCK_AGENT_DELAY)  # Thinking delay
         
-        intelligence = {
-            "STOCKS": {
-                "regime": "NEUTRAL / ACCUMULATION",
-                "color": "#ffff00",  # Yellow
-                "summary": "Equity markets showing consolidation after recent earnings volatility. Focus on defensive sectors.",
-                "confidence": 72,
-                "indicators": [
-                    ("✅ VIX Index", "14.2 (Stable)"),
-                    ("⚠️ Yield Curve", "Inverted (Recession risk)"),
-                    ("✅ Breadth", "58% Stocks > 50-day MA")
-                ],
-                "recommendation": "Maintain core equity exposure; hedge with high-dividend value stocks."
-            },
-            "CRYPTO": {
-                "regime": "ALTCOIN SEASON DETECTED",
-                "color": "#3fb950",  # Green
-                "summary": "BTC dominance dropping to 48% while Layer 1 protocols (SOL, AVAX) show massive institutional rotation.",
-                "confidence": 88,
-                "indicators": [
-                    ("✅ BTC Dominance", "48% (Dropping)"),
-                    ("✅ TVL Growth", "+12% in 24h"),
-                    ("⚠️ Funding Rates", "Elevated (Caution)")
-                ],
-                "recommendation": "Rotate capital from BTC to high-beta Layer 1s; tight stop losses at $118 for SOL."
-            },
-            "FOREX": {
-                "regime": "RISK-OFF EQUILIBRIUM",
-                "color": "#ff4444",  # Red
-                "summary": "Dollar strength persisting as Fed maintains hawkish stance. Major pairs hitting key resistance levels.",
-                "confidence": 65,
-                "indicators": [
-                    ("⚠️ DXY Strength", "104.5 (Breakout)"),
-                    ("✅ Treasury Yields", "4.2% (Support)"),
-                    ("⚠️ Sentiment", "Fear-driven flight to cash")
-                ],
-                "recommendation": "Short EUR/USD on retracement to 1.0920; target 1.0805."
-            },
-            "COMMODITIES": {
-                "regime": "SUPPLY-SIDE SQUEEZE",
-                "color": "#ff8800",  # Orange
-                "summary": "Geopolitical tensions in MEA driving Crude Oil premiums. Gold seeing safe-haven inflow despite USD strength.",
-                "confidence": 81,
-                "indicators": [
-                    ("✅ Geopolitical Risk", "High (Premium +$5)"),
-                    ("⚠️ Inventories", "3% below average"),
-                    ("✅ Gold Correlation", "Decoupling from USD")
-                ],
-                "recommendation": "Long Gold on pullbacks to $2,015; target $2,100 high."
-            },
-            "INDICES": {
-                "regime": "TECH LEADERSHIP CONCENTRATION",
-                "color": "#58a6ff",  # Blue
-                "summary": "S&P 500 driven largely by 'Magnificent 7' performance. Small caps lagging, showing market internal weakness.",
-                "confidence": 75,
-                "indicators": [
-                    ("✅ NDX/SPX Ratio", "All-time High"),
-                    ("⚠️ Advance-Decline", "Diverging (Bearish)"),
-                    ("✅ Put/Call Ratio", "0.85 (Bullish bias)")
-                ],
-                "recommendation": "Overweight NASDAQ; Underweight Russell 2000 until breadth improves."
-            },
-            "OPTIONS": {
-                "regime": "VOLATILITY COMPRESSION",
-                "color": "#FF00FF",  # Magenta
-                "summary": "Implied volatility trading at 12-month lows. Theta decay favoring sellers; cheap insurance for long-term holders.",
-                "confidence": 90,
-                "indicators": [
-                    ("✅ IV Rank", "12% (Extreme Low)"),
-                    ("✅ Skew", "Skewing to Puts (Hedging)"),
-                    ("⚠️ Gamma Exposure", "Positive (Market pinning)")
-                ],
-                "recommendation": "Buy LEAPS on Tech sector; Sell weekly iron condors on low-vol indices."
-            }
-        }
-        
-        result = intelligence.get(mode, intelligence["STOCKS"])
-        result["generated_at"] = datetime.now().strftime("%H:%M:%S")
-        return result
+        base = _INTELLIGENCE.get(mode, _INTELLIGENCE["STOCKS"])
+        return {**base, "generated_at": datetime.now().strftime("%H:%M:%S")}
 
 class QuantaiIntelligenceProvider(IntelligenceProvider):
     """
@@ -120,13 +127,26 @@ class AgentService:
     """
     
     _provider: IntelligenceProvider = MockIntelligenceProvider()
+    _insight_cache = TTLCache(maxsize=32, ttl=60)  # Insights refresh each minute
     
     @classmethod
     def set_provider(cls, provider: IntelligenceProvider):
         """Configure the service with a specific provider."""
         cls._provider = provider
+        cls._insight_cache.clear()
     
     @classmethod
     async def get_market_insight(cls, mode: str) -> Dict[str, Any]:
-        """Delegate to the active provider."""
-        return await cls._provider.get_insight(mode)
+        """Delegate to the active provider (cached per mode for 60s)."""
+        cached = cls._insight_cache.get(mode)
+        if cached is not None:
+            return dict(cached)  # Callers may mutate their copy
+        
+        insight = await cls._provider.get_insight(mode)
+        cls._insight_cache.set(mode, dict(insight))
+        return insight
+    
+    @classmethod
+    def cache_clear(cls):
+        """Drop cached insights."""
+        cls._insight_cache.clear()
@@ -5,17 +5,20 @@ Business logic for authentication, users, and API keys.
 Wires the security utilities with database models.
 """
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 import json
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.orm.attributes import set_committed_value
 
 from anchorgrid.db.models import User, Tenant, APIKey
 from anchorgrid.core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     generate_api_key,
     hash_api_key,
     create_access_token,
@@ -26,6 +29,103 @@ from anchorgrid.core.exceptions import (
     NotFoundError,
     ValidationError,
 )
+from anchorgrid.services.redis_service import get_cache, set_cache, delete_cache
+
+
+# API key lookups happen on every authenticated request
+API_KEY_CACHE_TTL = 60
+
+
+# Hot-path lookups as lambda statements: SQL is compiled once and cached,
+# later calls only bind parameters. lambda_stmt() evaluates its lambda, so
+# each statement is built on first use rather than at import.
+@lru_cache(maxsize=None)
+def _user_plan_by_email() -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(User, Tenant.plan)
+        .outerjoin(Tenant, Tenant.id == User.tenant_id)
+        .where(User.email == bindparam("email", type_=User.email.type))
+    )
+
+
+@lru_cache(maxsize=None)
+def _user_by_email() -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(User).where(User.email == bindparam("email", type_=User.email.type))
+    )
+
+
+@lru_cache(maxsize=None)
+def _user_by_id() -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(User).where(User.id == bindparam("user_id", type_=User.id.type))
+    )
+
+
+@lru_cache(maxsize=None)
+def _api_key_by_hash() -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(APIKey).where(APIKey.key_hash == bindparam("key_hash", type_=APIKey.key_hash.type))
+    )
+
+
+@lru_cache(maxsize=None)
+def _api_keys_by_user() -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(APIKey)
+        .where(APIKey.user_id == bindparam("user_id", type_=APIKey.user_id.type))
+        .where(APIKey.revoked_at.is_(None))
+        .order_by(APIKey.created_at.desc())
+    )
+
+
+def normalize_email(email: str) -> str:
+    """Emails are stored and looked up lowercased (see ix_users_email_lower)"""
+    return email.strip().lower()
+
+
+def _api_key_cache_key(key_hash: str) -> str:
+    return f"apk:{key_hash}"
+
+
+def _api_key_to_cache(api_key: APIKey) -> dict:
+    """Serialize the fields needed to authorize a request"""
+    def iso(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+    
+    return {
+        "id": str(api_key.id),
+        "tenant_id": str(api_key.tenant_id),
+        "user_id": str(api_key.user_id),
+        "name": api_key.name,
+        "key_hash": api_key.key_hash,
+        "key_prefix": api_key.key_prefix,
+        "permissions": api_key.permissions,
+        "is_active": api_key.is_active,
+        "expires_at": iso(api_key.expires_at),
+        "created_at": iso(api_key.created_at),
+        "revoked_at": iso(api_key.revoked_at),
+    }
+
+
+def _api_key_from_cache(data: dict) -> APIKey:
+    """Rebuild a detached APIKey from its cached fields"""
+    def dt(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
+    
+    return APIKey(
+        id=UUID(data["id"]),
+        tenant_id=UUID(data["tenant_id"]),
+        user_id=UUID(data["user_id"]),
+        name=data["name"],
+        key_hash=data["key_hash"],
+        key_prefix=data["key_prefix"],
+        permissions=data["permissions"],
+        is_active=data["is_active"],
+        expires_at=dt(data["expires_at"]),
+        created_at=dt(data["created_at"]),
+        revoked_at=dt(data["revoked_at"]),
+    )
 
 
 class AuthService:
@@ -52,58 +152,59 @@ class AuthService:
         Raises:
             AuthenticationError: If credentials are invalid
         """
-        # Find user by email
-        result = await self.session.execute(
-            select(User).where(User.email == email)
-        )
-        user = result.scalar_one_or_none()
+        email = normalize_email(email)
         
-        if user is None:
+        # Find user and tenant plan in one round trip
+        result = await self.session.execute(_user_plan_by_email(), {"email": email})
+        row = result.one_or_none()
+        
+        if row is None:
             raise AuthenticationError(message="Invalid email or password")
         
+        user, plan = row
+        
         if not user.is_active:
             raise AuthenticationError(message="Account is disabled")
         
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             raise AuthenticationError(message="Invalid email or password")
         
-        # Update login tracking
-        user.last_login_at = datetime.now(timezone.utc)
-        user.login_count += 1
-        await self.session.flush()
+        # Update login tracking (single targeted UPDATE, no ORM flush)
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(
+                last_login_at=func.now(),
+                login_count=func.coalesce(User.login_count, 0) + 1,
+            )
+            .returning(User.last_login_at, User.login_count)
+            .execution_options(synchronize_session=False)
+        )
+        last_login_at, login_count = result.one()
+        set_committed_value(user, "last_login_at", last_login_at)
+        set_committed_value(user, "login_count", login_count)
         
         # Generate tokens
         access_token = create_access_token(
             user_id=user.id,
             tenant_id=user.tenant_id,
             email=user.email,
-            plan=await self._get_user_plan(user),
+            plan=plan or "free",
             permissions=user.permission_list,
         )
         refresh_token = create_refresh_token(user_id=user.id)
         
         return user, access_token, refresh_token
     
-    async def _get_user_plan(self, user: User) -> str:
-        """Get user's tenant plan"""
-        result = await self.session.execute(
-            select(Tenant.plan).where(Tenant.id == user.tenant_id)
-        )
-        plan = result.scalar_one_or_none()
-        return plan or "free"
-    
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID"""
-        result = await self.session.execute(
-            select(User).where(User.id == user_id)
-        )
+        result = await self.session.execute(_user_by_id(), {"user_id": user_id})
         return result.scalar_one_or_none()
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        result = await self.session.execute(
-            select(User).where(User.email == email)
-        )
+        email = normalize_email(email)
+        result = await self.session.execute(_user_by_email(), {"email": email})
         return result.scalar_one_or_none()
     
     # =========================================================================
@@ -129,6 +230,8 @@ class AuthService:
         Raises:
             ValidationError: If email already exists
         """
+        email = normalize_email(email)
+        
         # Check if email exists
         existing = await self.get_user_by_email(email)
         if existing:
@@ -152,7 +255,7 @@ class AuthService:
         user = User(
             tenant_id=tenant.id,
             email=email,
-            password_hash=hash_password(password),
+            password_hash=await hash_password_async(password),
             name=name,
             role="owner",  # First user is owner
             permissions=json.dumps(["read", "write", "admin"]),
@@ -206,20 +309,31 @@ class AuthService:
         return api_key, raw_key
     
     async def get_api_key_by_hash(self, key_hash: str) -> Optional[APIKey]:
-        """Get API key by hash (for authentication)"""
-        result = await self.session.execute(
-            select(APIKey).where(APIKey.key_hash == key_hash)
-        )
-        return result.scalar_one_or_none()
+        """
+        Get API key by hash (for authentication).
+        
+        Cached in Redis for API_KEY_CACHE_TTL seconds; a cache hit returns a
+        detached APIKey carrying the status/expiry fields needed by is_valid.
+        """
+        cached = await get_cache(_api_key_cache_key(key_hash))
+        if cached:
+            return _api_key_from_cache(cached)
+        
+        result = await self.session.execute(_api_key_by_hash(), {"key_hash": key_hash})
+        api_key = result.scalar_one_or_none()
+        
+        if api_key is not None:
+            await set_cache(
+                _api_key_cache_key(key_hash),
+                _api_key_to_cache(api_key),
+                ttl=API_KEY_CACHE_TTL,
+            )
+        
+        return api_key
     
     async def list_user_api_keys(self, user_id: UUID) -> list[APIKey]:
         """List all API keys for a user"""
-        result = await self.session.execute(
-            select(APIKey)
-            .where(APIKey.user_id == user_id)
-            .where(APIKey.revoked_at.is_(None))
-            .order_by(APIKey.created_at.desc())
-        )
+        result = await self.session.execute(_api_keys_by_user(), {"user_id": user_id})
         return list(result.scalars().all())
     
     async def revoke_api_key(self, key_id: UUID, user_id: UUID) -> bool:
@@ -243,10 +357,22 @@ class AuthService:
         api_key.is_active = False
         await self.session.flush()
         
+        await delete_cache(_api_key_cache_key(api_key.key_hash))
+        
         return True
     
     async def record_api_key_usage(self, api_key: APIKey) -> None:
         """Record API key usage"""
-        api_key.last_used_at = datetime.now(timezone.utc)
-        api_key.usage_count += 1
-        await self.session.flush()
+        result = await self.session.execute(
+            update(APIKey)
+            .where(APIKey.id == api_key.id)
+            .values(
+                last_used_at=func.now(),
+                usage_count=func.coalesce(APIKey.usage_count, 0) + 1,
+            )
+            .returning(APIKey.last_used_at, APIKey.usage_count)
+            .execution_options(synchronize_session=False)
+        )
+        last_used_at, usage_count = result.one()
+        set_committed_value(api_key, "last_used_at", last_used_at)
+        set_committed_value(api_key, "usage_count", usage_count)
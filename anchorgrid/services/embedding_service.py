@@ -5,12 +5,20 @@ Generate text embeddings using Ollama (local) or OpenAI (fallback).
 Used for vectorizing market data, news, and analysis for RAG.
 """
 import asyncio
+import base64
+import hashlib
+import time
 import httpx
+import numpy as np
+import orjson
 from typing import Optional
 
 from loguru import logger
 
 from anchorgrid.core.config import settings
+from anchorgrid.services.redis_service import (
+    get_cache, set_cache, get_cache_many, set_cache_many
+)
 
 
 # =============================================================================
@@ -25,6 +33,64 @@ OLLAMA_EMBED_DIMS = 768
 OPENAI_EMBED_MODEL = "text-embedding-3-small"
 OPENAI_EMBED_DIMS = 1536
 
+# Embedding cache (vectors are deterministic per model + text)
+EMBED_CACHE_TTL = 7 * 86400  # Documents: news, filings, analysis
+QUERY_EMBED_CACHE_TTL = 86400  # Ad-hoc user queries
+
+# Cached vectors are stored as int8 + float32 scale (4x smaller than float32)
+# unless EMBED_QUANTIZE is disabled; both encodings are always readable.
+QUANTIZED_PREFIX = "q8:"
+
+# HTTP connection pool (long-lived keep-alive connections)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+HTTP_RETRIES = 2
+
+# Re-probe Ollama availability after this many seconds
+OLLAMA_PROBE_TTL = 60.0
+
+
+# =============================================================================
+# CACHE ENCODING
+# =============================================================================
+
+def quantize_embedding(vector: np.ndarray) -> str:
+    """
+    Symmetric int8 quantization for cache storage.
+    
+    Layout: float32 scale followed by one int8 per dimension, base64'd so it
+    fits the JSON/text Redis client. Cosine ranking is preserved to ~1%.
+    """
+    arr = np.asarray(vector, dtype=np.float32)
+    scale = np.float32(np.max(np.abs(arr)) / 127.0) if arr.size else np.float32(0.0)
+    if scale == 0:
+        q = np.zeros(arr.shape, dtype=np.int8)
+    else:
+        q = np.round(arr / scale).astype(np.int8)
+    payload = scale.tobytes() + q.tobytes()
+    return QUANTIZED_PREFIX + base64.b64encode(payload).decode("ascii")
+
+
+def dequantize_embedding(cached) -> np.ndarray:
+    """Decode a cached vector (quantized string or plain float list)"""
+    if not isinstance(cached, str):
+        return np.asarray(cached, dtype=np.float32)
+    
+    payload = base64.b64decode(cached[len(QUANTIZED_PREFIX):])
+    scale = np.frombuffer(payload[:4], dtype=np.float32)[0]
+    q = np.frombuffer(payload[4:], dtype=np.int8)
+    return q.astype(np.float32) * scale
+
+
+def _encode_for_cache(vector: np.ndarray):
+    if settings.EMBED_QUANTIZE:
+        return quantize_embedding(vector)
+    return vector.tolist()  # JSON boundary
+
 
 # =============================================================================
 # EMBEDDING SERVICE
@@ -48,163 +114,290 @@ class EmbeddingService:
     ):
         self.ollama_url = ollama_url or getattr(settings, "OLLAMA_URL", "http://localhost:11434")
         self.openai_api_key = openai_api_key or getattr(settings, "OPENAI_API_KEY", "")
-        self._http_client = None
+        self._http_client = None  # OpenAI (HTTP/2, multiplexed over one TLS connection)
+        self._ollama_client = None  # Ollama (local, pooled per host)
+        self._client_lock = asyncio.Lock()
         self._ollama_available = None
+        self._ollama_checked_at = float("-inf")  # Probe on first use
+        self._ollama_lock = asyncio.Lock()
+    
+    @staticmethod
+    def _build_client(http2: bool = False, **kwargs) -> httpx.AsyncClient:
+        """Create a pooled keep-alive HTTP client"""
+        transport = httpx.AsyncHTTPTransport(
+            limits=HTTP_LIMITS,
+            retries=HTTP_RETRIES,
+            http2=http2,
+        )
+        return httpx.AsyncClient(timeout=HTTP_TIMEOUT, transport=transport, **kwargs)
+    
+    @staticmethod
+    async def _post_json(
+        client: httpx.AsyncClient,
+        url: str,
+        payload: dict,
+        headers: Optional[dict] = None,
+    ) -> dict:
+        """POST a JSON body and decode the JSON response with orjson"""
+        resp = await client.post(
+            url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json", **(headers or {})},
+        )
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
+        """Get or create the OpenAI HTTP client"""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=60.0)
+            async with self._client_lock:
+                if self._http_client is None:
+                    self._http_client = self._build_client(http2=True)
         return self._http_client
     
+    async def _get_ollama_client(self) -> httpx.AsyncClient:
+        """Get or create the Ollama HTTP client"""
+        if self._ollama_client is None:
+            async with self._client_lock:
+                if self._ollama_client is None:
+                    self._ollama_client = self._build_client(base_url=self.ollama_url)
+        return self._ollama_client
+    
     async def _check_ollama(self) -> bool:
-        """Check if Ollama is available"""
-        if self._ollama_available is not None:
+        """
+        Check if Ollama is available.
+        
+        The result is cached for OLLAMA_PROBE_TTL seconds, so a transient
+        failure doesn't pin us to the OpenAI fallback forever. Only one
+        probe runs at a time; concurrent callers wait for its result.
+        """
+        if time.monotonic() - self._ollama_checked_at < OLLAMA_PROBE_TTL:
             return self._ollama_available
         
-        try:
-            client = await self._get_client()
-            resp = await client.get(f"{self.ollama_url}/api/tags")
-            self._ollama_available = resp.status_code == 200
+        async with self._ollama_lock:
+            # Another caller may have probed while we waited
+            if time.monotonic() - self._ollama_checked_at < OLLAMA_PROBE_TTL:
+                return self._ollama_available
             
-            if self._ollama_available:
-                # Check if embedding model is available
-                models = resp.json().get("models", [])
-                model_names = [m.get("name", "") for m in models]
-                if not any(OLLAMA_EMBED_MODEL in name for name in model_names):
-                    logger.warning(f"Ollama model {OLLAMA_EMBED_MODEL} not found. Pull it with: ollama pull {OLLAMA_EMBED_MODEL}")
+            try:
+                client = await self._get_ollama_client()
+                resp = await client.get("/api/tags")
+                self._ollama_available = resp.status_code == 200
+                
+                if self._ollama_available:
+                    # Check if embedding model is available
+                    models = orjson.loads(resp.content).get("models", [])
+                    model_names = [m.get("name", "") for m in models]
+                    if not any(OLLAMA_EMBED_MODEL in name for name in model_names):
+                        logger.warning(f"Ollama model {OLLAMA_EMBED_MODEL} not found. Pull it with: ollama pull {OLLAMA_EMBED_MODEL}")
+            except Exception as e:
+                logger.debug(f"Ollama not available: {e}")
+                self._ollama_available = False
             
+            self._ollama_checked_at = time.monotonic()
             return self._ollama_available
-        except Exception as e:
-            logger.debug(f"Ollama not available: {e}")
-            self._ollama_available = False
-            return False
     
     # -------------------------------------------------------------------------
     # MAIN EMBEDDING METHODS
     # -------------------------------------------------------------------------
     
-    async def embed(self, text: str) -> list[float]:
+    @staticmethod
+    def _cache_key(model: str, text: str) -> str:
+        """Content-hash cache key for an embedding"""
+        return f"emb:{model}:{hashlib.sha256(text.encode()).hexdigest()}"
+    
+    async def embed(self, text: str, cache_ttl: int = EMBED_CACHE_TTL) -> np.ndarray:
         """
         Generate embedding for a single text.
         
+        Results are cached in Redis by model + SHA-256 of the text.
+        
         Args:
             text: Text to embed
+            cache_ttl: Cache lifetime in seconds
             
         Returns:
-            Embedding vector (768 or 1536 dims depending on model)
+            float32 embedding vector (768 or 1536 dims depending on model)
         """
         # Try Ollama first (FREE)
         if await self._check_ollama():
+            key = self._cache_key(OLLAMA_EMBED_MODEL, text)
+            cached = await get_cache(key)
+            if cached:
+                return dequantize_embedding(cached)
+            
             try:
-                return await self._embed_ollama(text)
+                vector = await self._embed_ollama(text)
+                await set_cache(key, _encode_for_cache(vector), ttl=cache_ttl)
+                return vector
             except Exception as e:
                 logger.warning(f"Ollama embedding failed: {e}")
         
         # Fallback to OpenAI
         if self.openai_api_key:
-            return await self._embed_openai(text)
+            key = self._cache_key(OPENAI_EMBED_MODEL, text)
+            cached = await get_cache(key)
+            if cached:
+                return dequantize_embedding(cached)
+            
+            vector = await self._embed_openai(text)
+            await set_cache(key, _encode_for_cache(vector), ttl=cache_ttl)
+            return vector
         
         # Last resort: return zero vector (not recommended for production)
         logger.error("No embedding service available!")
-        return [0.0] * OLLAMA_EMBED_DIMS
+        return np.zeros(OLLAMA_EMBED_DIMS, dtype=np.float32)
     
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def embed_batch(
+        self,
+        texts: list[str],
+        cache_ttl: int = EMBED_CACHE_TTL,
+    ) -> np.ndarray:
         """
         Generate embeddings for multiple texts.
         
+        Cached vectors are fetched with one MGET; only the misses are sent
+        to the embedding backend, then written back in one pipeline.
+        
         Args:
             texts: List of texts to embed
+            cache_ttl: Cache lifetime in seconds
             
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dims)
         """
-        # For Ollama, we need to embed one at a time (no batch API)
         if await self._check_ollama():
-            results = []
-            for text in texts:
-                try:
-                    vec = await self._embed_ollama(text)
-                    results.append(vec)
-                except Exception as e:
-                    logger.error(f"Ollama batch embed failed: {e}")
-                    results.append([0.0] * OLLAMA_EMBED_DIMS)
-            return results
+            model, dims = OLLAMA_EMBED_MODEL, OLLAMA_EMBED_DIMS
+            embed_misses = self._embed_ollama_batch
+        elif self.openai_api_key:
+            model, dims = OPENAI_EMBED_MODEL, OPENAI_EMBED_DIMS
+            embed_misses = self._embed_openai_batch
+        else:
+            return np.zeros((len(texts), OLLAMA_EMBED_DIMS), dtype=np.float32)
         
-        # OpenAI supports batch
-        if self.openai_api_key:
-            return await self._embed_openai_batch(texts)
+        out = np.empty((len(texts), dims), dtype=np.float32)
+        keys = [self._cache_key(model, text) for text in texts]
+        
+        misses = []
+        for i, cached in enumerate(await get_cache_many(keys)):
+            if cached:
+                out[i] = dequantize_embedding(cached)
+            else:
+                misses.append(i)
         
-        return [[0.0] * OLLAMA_EMBED_DIMS for _ in texts]
+        if misses:
+            vectors = await embed_misses([texts[i] for i in misses])
+            out[misses] = vectors
+            
+            to_cache = {
+                keys[i]: _encode_for_cache(vector)
+                for i, vector in zip(misses, vectors)
+                if vector.any()  # Never cache failure placeholders
+            }
+            await set_cache_many(to_cache, ttl=cache_ttl)
+        
+        return out
     
     # -------------------------------------------------------------------------
     # OLLAMA IMPLEMENTATION
     # -------------------------------------------------------------------------
     
-    async def _embed_ollama(self, text: str) -> list[float]:
+    async def _embed_ollama_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed several texts with Ollama.
+        
+        Ollama has no batch API, so fan out concurrently with a bounded
+        number of in-flight requests. Failures become zero vectors.
+        """
+        semaphore = asyncio.Semaphore(settings.OLLAMA_EMBED_CONCURRENCY)
+        
+        async def embed_one(text: str) -> np.ndarray:
+            async with semaphore:
+                try:
+                    return await self._embed_ollama(text)
+                except Exception as e:
+                    logger.error(f"Ollama batch embed failed: {e}")
+                    return np.zeros(OLLAMA_EMBED_DIMS, dtype=np.float32)
+        
+        vectors = await asyncio.gather(*(embed_one(text) for text in texts))
+        return np.stack(vectors) if vectors else np.empty((0, OLLAMA_EMBED_DIMS), dtype=np.float32)
+    
+    async def _embed_ollama(self, text: str) -> np.ndarray:
         """Generate embedding using Ollama"""
-        client = await self._get_client()
+        client = await self._get_ollama_client()
         
-        resp = await client.post(
-            f"{self.ollama_url}/api/embeddings",
-            json={
+        data = await self._post_json(
+            client,
+            "/api/embeddings",
+            {
                 "model": OLLAMA_EMBED_MODEL,
                 "prompt": text,
             },
         )
-        resp.raise_for_status()
-        
-        data = resp.json()
         embedding = data.get("embedding", [])
         
         if not embedding:
             raise ValueError("Empty embedding returned from Ollama")
         
         logger.debug(f"Ollama embedding: {len(text)} chars → {len(embedding)} dims")
-        return embedding
+        return np.asarray(embedding, dtype=np.float32)
     
     # -------------------------------------------------------------------------
     # OPENAI IMPLEMENTATION
     # -------------------------------------------------------------------------
     
-    async def _embed_openai(self, text: str) -> list[float]:
+    async def _embed_openai(self, text: str) -> np.ndarray:
         """Generate embedding using OpenAI API"""
         client = await self._get_client()
         
-        resp = await client.post(
+        data = await self._post_json(
+            client,
             "https://api.openai.com/v1/embeddings",
-            headers={"Authorization": f"Bearer {self.openai_api_key}"},
-            json={
+            {
                 "model": OPENAI_EMBED_MODEL,
                 "input": text,
             },
+            headers={"Authorization": f"Bearer {self.openai_api_key}"},
         )
-        resp.raise_for_status()
-        
-        data = resp.json()
         embedding = data["data"][0]["embedding"]
         
         logger.debug(f"OpenAI embedding: {len(text)} chars → {len(embedding)} dims")
-        return embedding
+        return np.asarray(embedding, dtype=np.float32)
     
-    async def _embed_openai_batch(self, texts: list[str]) -> list[list[float]]:
-        """Batch embedding using OpenAI API"""
+    async def _embed_openai_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Batch embedding using OpenAI API.
+        
+        OpenAI caps a request at 2048 inputs, so large batches are split into
+        OPENAI_EMBED_CHUNK_SIZE chunks sent concurrently (bounded by
+        OPENAI_EMBED_CONCURRENCY) and written into one preallocated array.
+        """
         client = await self._get_client()
+        chunk_size = settings.OPENAI_EMBED_CHUNK_SIZE
+        semaphore = asyncio.Semaphore(settings.OPENAI_EMBED_CONCURRENCY)
+        out = np.empty((len(texts), OPENAI_EMBED_DIMS), dtype=np.float32)
         
-        resp = await client.post(
-            "https://api.openai.com/v1/embeddings",
-            headers={"Authorization": f"Bearer {self.openai_api_key}"},
-            json={
-                "model": OPENAI_EMBED_MODEL,
-                "input": texts,
-            },
-        )
-        resp.raise_for_status()
+        async def embed_chunk(offset: int, chunk: list[str]):
+            async with semaphore:
+                data = await self._post_json(
+                    client,
+                    "https://api.openai.com/v1/embeddings",
+                    {
+                        "model": OPENAI_EMBED_MODEL,
+                        "input": chunk,
+                    },
+                    headers={"Authorization": f"Bearer {self.openai_api_key}"},
+                )
+            
+            # Place by index to maintain order
+            for e in data["data"]:
+                out[offset + e["index"]] = e["embedding"]
         
-        data = resp.json()
-        # Sort by index to maintain order
-        embeddings = sorted(data["data"], key=lambda x: x["index"])
-        return [e["embedding"] for e in embeddings]
+        await asyncio.gather(*(
+            embed_chunk(i, texts[i:i + chunk_size])
+            for i in range(0, len(texts), chunk_size)
+        ))
+        return out
     
     # -------------------------------------------------------------------------
     # UTILITIES
@@ -219,10 +412,13 @@ class EmbeddingService:
         return OLLAMA_EMBED_DIMS
     
     async def close(self):
-        """Close the HTTP client"""
+        """Close the HTTP clients"""
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+        if self._ollama_client:
+            await self._ollama_client.aclose()
+            self._ollama_client = None
 
 
 # =============================================================================
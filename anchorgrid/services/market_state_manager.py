@@ -423,7 +423,8 @@ class MarketStateManager:
             hist_data = yfinance_scraper.get_historical(
                 ticker, 
                 period=f"{lookback_days}d" if lookback_days <= 730 else "max",
-                interval=interval
+                interval=interval,
+                format="records"
             )
             
             if not hist_data or not hist_data.get("data"):
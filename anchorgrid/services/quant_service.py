@@ -4,38 +4,100 @@ AnchorGrid AI Engine - Quantitative Analysis Service
 Wires the quantitative engine with the API layer.
 Provides high-level analysis functions.
 """
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import NamedTuple, Optional
+import hashlib
+import time
 import numpy as np
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+from anchorgrid.core.cache import TTLCache
+
 from anchorgrid.plugins.finance.extractors import (
     # Indicators
     ema,
+    ema_last,
     rsi,
+    rsi_last,
     macd,
     bollinger_bands,
     atr,
+    atr_last,
     # Regime
     VolatilityRegime,
     TrendRegime,
     RegimeState,
-    detect_volatility_regime,
-    detect_trend_regime,
+    detect_volatility_regime_from_close,
+    detect_trend_regime_from_values,
     # Composite
     Signal,
     CompositeScore,
     calculate_composite_score,
+    calculate_composite_scores,
     # State
     IndicatorState,
 )
+from anchorgrid.plugins.finance.extractors.indicators import (
+    NUMBA_AVAILABLE,
+    ema_weights,
+    latest_indicators_batch,
+    wilder_weights,
+)
+
+
+def _warmup_indicators():
+    """Trigger JIT compilation so the first real request doesn't pay for it"""
+    prices = np.linspace(1.0, 2.0, 64)
+    ema(prices, 20)
+    rsi(prices, 14)
+    macd(prices)
+    bollinger_bands(prices)
+    atr(prices, prices, prices)
+    atr_last(prices, prices, prices)
+
+
+if NUMBA_AVAILABLE:
+    _warmup_indicators()
+
+
+class _AnalysisTables(NamedTuple):
+    """Per-length weight tables for the analyze() tail indicators"""
+    ema_20: np.ndarray
+    ema_50: np.ndarray
+    rsi_14: np.ndarray
+
+
+def _content_hash(*arrays: Optional[np.ndarray]) -> int:
+    """Fast hash of the raw bytes of the given arrays (None-safe)"""
+    hasher = xxhash.xxh64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=8)
+    for arr in arrays:
+        hasher.update(b"\x00" if arr is None else arr.tobytes())
+        hasher.update(b"|")
+    return int.from_bytes(hasher.digest(), "little")
+
+
+@lru_cache(maxsize=32)
+def _precompute_tables(n: int) -> _AnalysisTables:
+    """Tables for an n-point history (requests mostly share a few lengths)"""
+    return _AnalysisTables(
+        ema_20=ema_weights(20, n),
+        ema_50=ema_weights(50, n),
+        rsi_14=wilder_weights(14, n),
+    )
 
 
 @dataclass
 class TechnicalAnalysis:
     """Complete technical analysis result for a ticker"""
     ticker: str
-    timestamp: datetime
+    timestamp_ns: int  # UTC epoch nanoseconds
     price: float
     
     # Indicators
@@ -55,6 +117,54 @@ class TechnicalAnalysis:
     
     # Signal
     composite: CompositeScore
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Analysis time as a naive UTC datetime (built on access)"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class TechnicalAnalysisBatch:
+    """
+    Latest indicator values for many tickers (struct-of-arrays).
+    
+    Slot i of every array belongs to tickers[i]; NaN marks a missing value
+    where TechnicalAnalysis would hold None.
+    """
+    tickers: np.ndarray  # object
+    price: np.ndarray
+    ema_20: np.ndarray
+    ema_50: np.ndarray
+    rsi_14: np.ndarray
+    macd_line: np.ndarray
+    macd_signal: np.ndarray
+    macd_histogram: np.ndarray
+    score: np.ndarray
+    confidence: np.ndarray
+    signal: np.ndarray  # object (Signal)
+    
+    def __len__(self) -> int:
+        return len(self.tickers)
+    
+    def record(self, i: int) -> dict:
+        """Row i as plain Python values (for API responses)"""
+        def opt(value) -> Optional[float]:
+            return None if np.isnan(value) else float(value)
+        
+        return {
+            "ticker": self.tickers[i],
+            "price": opt(self.price[i]),
+            "ema_20": opt(self.ema_20[i]),
+            "ema_50": opt(self.ema_50[i]),
+            "rsi_14": opt(self.rsi_14[i]),
+            "macd_line": opt(self.macd_line[i]),
+            "macd_signal": opt(self.macd_signal[i]),
+            "macd_histogram": opt(self.macd_histogram[i]),
+            "score": float(self.score[i]),
+            "confidence": float(self.confidence[i]),
+            "signal": self.signal[i],
+        }
 
 
 class QuantService:
@@ -64,9 +174,23 @@ class QuantService:
     Provides technical analysis, regime detection, and signal generation.
     """
     
+    ANALYSIS_CACHE_SIZE = 4096
+    
     def __init__(self):
         # Per-ticker state machines for real-time updates
         self._ticker_states: dict[str, IndicatorState] = {}
+        # analyze() is deterministic in its price arrays: memoize by content
+        self._analysis_cache = TTLCache(maxsize=self.ANALYSIS_CACHE_SIZE, ttl=float("inf"))
+        # Per-ticker log-return buffers for the regime detection
+        self._scratch_log: dict[str, np.ndarray] = {}
+    
+    def _get_scratch(self, ticker: str, n: int) -> np.ndarray:
+        """Reusable float64 buffer of at least n elements for a ticker"""
+        buf = self._scratch_log.get(ticker)
+        if buf is None or len(buf) < n:
+            buf = np.empty(n, dtype=np.float64)
+            self._scratch_log[ticker] = buf
+        return buf
     
     def get_ticker_state(self, ticker: str) -> IndicatorState:
         """Get or create state machine for a ticker"""
@@ -83,12 +207,22 @@ class QuantService:
         state = self.get_ticker_state(ticker)
         return state.update(price)
     
+    def update_prices(self, ticker: str, prices: np.ndarray) -> dict:
+        """
+        Update indicators with a block of prices (oldest first).
+        
+        Use this for bulk backfills; the loop releases the GIL under numba,
+        so several tickers can be backfilled from a thread pool.
+        """
+        state = self.get_ticker_state(ticker)
+        return state.update_batch(prices)
+    
     def analyze(
         self,
         ticker: str,
-        prices: list[float],
-        highs: Optional[list[float]] = None,
-        lows: Optional[list[float]] = None,
+        prices: list[float] | np.ndarray,
+        highs: Optional[list[float] | np.ndarray] = None,
+        lows: Optional[list[float] | np.ndarray] = None,
         timestamp: Optional[datetime] = None,
     ) -> TechnicalAnalysis:
         """
@@ -96,48 +230,70 @@ class QuantService:
         
         Args:
             ticker: Stock/crypto ticker symbol
-            prices: List of closing prices (oldest first)
-            highs: Optional list of high prices (for ATR)
-            lows: Optional list of low prices (for ATR)
-            timestamp: Analysis timestamp (default: now)
+            prices: Closing prices, oldest first (list or float64 array;
+                arrays are used without copying)
+            highs: Optional high prices (for ATR)
+            lows: Optional low prices (for ATR)
+            timestamp: Analysis timestamp, naive UTC (default: now)
             
         Returns:
             TechnicalAnalysis with all indicators and signals
         """
         if timestamp is None:
-            timestamp = datetime.utcnow()
+            timestamp_ns = time.time_ns()
+        else:
+            timestamp_ns = int(timestamp.replace(tzinfo=timestamp.tzinfo or timezone.utc).timestamp() * 1e9)
+        
+        # Convert to numpy arrays (no copy for float64 arrays, e.g. from
+        # get_historical(format="arrays"))
+        close = np.asarray(prices, dtype=np.float64)
+        high = low = None
+        if highs is not None and lows is not None and len(highs) and len(lows):
+            high = np.asarray(highs, dtype=np.float64)
+            low = np.asarray(lows, dtype=np.float64)
+        
+        key = (len(close), _content_hash(close, high, low))
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return replace(cached, ticker=ticker, timestamp_ns=timestamp_ns)
         
-        # Convert to numpy arrays
-        close = np.array(prices, dtype=np.float64)
         current_price = close[-1]
         
-        # Calculate indicators
-        ema_20_arr = ema(close, 20)
-        ema_50_arr = ema(close, 50)
-        rsi_arr = rsi(close, 14)
+        # Calculate indicators (tails via per-length weight tables)
+        tables = _precompute_tables(len(close))
+        ema_20_last = ema_last(close, 20, tables.ema_20)
+        ema_50_last = ema_last(close, 50, tables.ema_50)
+        rsi_tail = rsi_last(close, 14, tables.rsi_14)
         macd_line_arr, macd_signal_arr, macd_hist_arr = macd(close)
         bb_upper_arr, bb_middle_arr, bb_lower_arr = bollinger_bands(close)
         
         # ATR requires high/low
-        atr_value = None
-        if highs and lows:
-            high = np.array(highs, dtype=np.float64)
-            low = np.array(lows, dtype=np.float64)
-            atr_arr = atr(high, low, close)
-            atr_value = float(atr_arr[-1]) if not np.isnan(atr_arr[-1]) else None
-        
-        # Get latest values
-        ema_20_val = float(ema_20_arr[-1]) if not np.isnan(ema_20_arr[-1]) else None
-        ema_50_val = float(ema_50_arr[-1]) if not np.isnan(ema_50_arr[-1]) else None
-        rsi_val = float(rsi_arr[-1]) if not np.isnan(rsi_arr[-1]) else None
-        macd_line_val = float(macd_line_arr[-1]) if not np.isnan(macd_line_arr[-1]) else None
-        macd_signal_val = float(macd_signal_arr[-1]) if not np.isnan(macd_signal_arr[-1]) else None
-        macd_hist_val = float(macd_hist_arr[-1]) if not np.isnan(macd_hist_arr[-1]) else None
+        atr_tail = np.nan
+        if high is not None:
+            atr_tail = atr_last(high, low, close)
+        
+        # Get latest values (one NaN check for all of them)
+        tails = np.array([
+            ema_20_last, ema_50_last, rsi_tail,
+            macd_line_arr[-1], macd_signal_arr[-1], macd_hist_arr[-1],
+            bb_upper_arr[-1], bb_middle_arr[-1], bb_lower_arr[-1], atr_tail,
+        ])
+        (
+            ema_20_val, ema_50_val, rsi_val,
+            macd_line_val, macd_signal_val, macd_hist_val,
+            bb_upper_val, bb_middle_val, bb_lower_val, atr_value,
+        ) = [None if missing else value for value, missing in zip(tails.tolist(), np.isnan(tails).tolist())]
         
         # Regime detection
-        returns = np.diff(np.log(close))
-        vol_regime, vol_pct = detect_volatility_regime(returns)
-        trend_regime, trend_strength = detect_trend_regime(close, ema_20_arr, ema_50_arr)
+        vol_regime, vol_pct = detect_volatility_regime_from_close(
+            close, scratch=self._get_scratch(ticker, len(close))
+        )
+        if len(close) < 2:
+            trend_regime, trend_strength = TrendRegime.SIDEWAYS, 0.0
+        else:
+            trend_regime, trend_strength = detect_trend_regime_from_values(
+                current_price, ema_20_last, ema_50_last
+            )
         
         regime = RegimeState(
             volatility=vol_regime,
@@ -159,9 +315,9 @@ class QuantService:
             ema_50=ema_50_val,
         )
         
-        return TechnicalAnalysis(
+        analysis = TechnicalAnalysis(
             ticker=ticker,
-            timestamp=timestamp,
+            timestamp_ns=timestamp_ns,
             price=current_price,
             ema_20=ema_20_val,
             ema_50=ema_50_val,
@@ -169,13 +325,52 @@ class QuantService:
             macd_line=macd_line_val,
             macd_signal=macd_signal_val,
             macd_histogram=macd_hist_val,
-            bb_upper=float(bb_upper_arr[-1]) if not np.isnan(bb_upper_arr[-1]) else None,
-            bb_middle=float(bb_middle_arr[-1]) if not np.isnan(bb_middle_arr[-1]) else None,
-            bb_lower=float(bb_lower_arr[-1]) if not np.isnan(bb_lower_arr[-1]) else None,
+            bb_upper=bb_upper_val,
+            bb_middle=bb_middle_val,
+            bb_lower=bb_lower_val,
             atr_14=atr_value,
             regime=regime,
             composite=composite,
         )
+        self._analysis_cache.set(key, analysis)
+        return analysis
+    
+    def analyze_batch(self, tickers: list[str], prices_matrix: np.ndarray) -> TechnicalAnalysisBatch:
+        """
+        Compute latest EMA/RSI/MACD values for many tickers in one call.
+        
+        Args:
+            tickers: Ticker symbols, one per row
+            prices_matrix: (len(tickers), N) closing prices, oldest first,
+                left-padded with NaN for shorter histories
+            
+        Returns:
+            TechnicalAnalysisBatch with (len(tickers),) arrays (NaN during warmup)
+        """
+        prices_matrix = np.asarray(prices_matrix, dtype=np.float64)
+        
+        # Column-major so each indicator is one contiguous (T,) array
+        values = np.asfortranarray(latest_indicators_batch(prices_matrix))
+        ema_20, ema_50, rsi_14, macd_line, macd_signal, macd_hist = values.T
+        price = prices_matrix[:, -1].copy()
+        
+        score, confidence, signal = calculate_composite_scores(
+            price, rsi_14, macd_line, macd_signal, macd_hist, ema_20, ema_50,
+        )
+        
+        return TechnicalAnalysisBatch(
+            tickers=np.array(tickers, dtype=object),
+            price=price,
+            ema_20=ema_20,
+            ema_50=ema_50,
+            rsi_14=rsi_14,
+            macd_line=macd_line,
+            macd_signal=macd_signal,
+            macd_histogram=macd_hist,
+            score=score,
+            confidence=confidence,
+            signal=signal,
+        )
     
     def get_signal(
         self,
@@ -15,7 +15,7 @@ from anchorgrid.engine.memory.weaviate_store import (
     VectorDocument,
     SearchResult,
 )
-from anchorgrid.services.embedding_service import embedding_service
+from anchorgrid.services.embedding_service import embedding_service, QUERY_EMBED_CACHE_TTL
 
 
 # =============================================================================
@@ -97,11 +97,11 @@ class RAGService:
             await self.initialize()
         
         # Embed the query
-        query_vector = await self.embedder.embed(query)
+        query_vector = await self.embedder.embed(query, cache_ttl=QUERY_EMBED_CACHE_TTL)
         
         # Search for relevant documents
         results = await self.store.search(
-            query_vector=query_vector,
+            query_vector=query_vector.tolist(),  # Weaviate client expects JSON-able lists
             ticker=ticker,
             content_type=content_types[0] if content_types and len(content_types) == 1 else None,
             tenant_id=tenant_id,
@@ -198,7 +198,7 @@ class RAGService:
         vector = await self.embedder.embed(content)
         
         # Store in Weaviate
-        uuid = await self.store.upsert(doc, vector)
+        uuid = await self.store.upsert(doc, vector.tolist())
         
         logger.info(f"Indexed {content_type} for {ticker}: {uuid[:8]}...")
         return uuid
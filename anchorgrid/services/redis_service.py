@@ -7,17 +7,25 @@ from redis.asyncio import Redis
 from anchorgrid.core.config import get_settings
 from loguru import logger as log
 import json
+import time
 from typing import Any
 
 settings = get_settings()
 
 redis_client: Redis | None = None
 
+# After a failed connect, skip reconnect attempts for this many seconds so
+# every cache call doesn't pay the connect timeout while Redis is down
+REDIS_RETRY_INTERVAL = 30.0
+_redis_failed_at = float("-inf")
+
 
 async def get_redis_client() -> Redis | None:
-    """Get or create Redis client"""
-    global redis_client
+    """Get or create Redis client (None while Redis is unreachable)"""
+    global redis_client, _redis_failed_at
     if redis_client is None:
+        if time.monotonic() - _redis_failed_at < REDIS_RETRY_INTERVAL:
+            return None
         try:
             redis_client = Redis.from_url(
                 settings.REDIS_URL,
@@ -27,8 +35,9 @@ async def get_redis_client() -> Redis | None:
             await redis_client.ping()
             log.info("✅ Redis client initialized")
         except Exception as e:
-            log.error(f"❌ Redis connection failed: {e}")
+            log.error(f"❌ Redis connection failed: {e} (retrying in {REDIS_RETRY_INTERVAL:.0f}s)")
             redis_client = None
+            _redis_failed_at = time.monotonic()
     return redis_client
 
 
@@ -88,6 +97,56 @@ async def get_cache(key: str) -> Any | None:
         return None
 
 
+async def get_cache_many(keys: list[str]) -> list[Any | None]:
+    """
+    Retrieve several keys in one round trip (MGET)
+    
+    Returns:
+        List aligned with keys; None for misses
+    """
+    if not keys:
+        return []
+    
+    client = await get_redis_client()
+    if client is None:
+        return [None] * len(keys)
+    
+    try:
+        values = await client.mget(keys)
+        return [json.loads(v) if v else None for v in values]
+    except Exception as e:
+        log.error(f"Redis mget failed for {len(keys)} keys: {e}")
+        return [None] * len(keys)
+
+
+async def set_cache_many(items: dict[str, Any], ttl: int = 3600) -> bool:
+    """
+    Cache several values with the same TTL in one pipelined round trip
+    
+    Args:
+        items: Mapping of cache key -> JSON-serializable value
+        ttl: Time to live in seconds (default 1 hour)
+    """
+    if not items:
+        return True
+    
+    client = await get_redis_client()
+    if client is None:
+        log.warning("Redis unavailable - cache skip")
+        return False
+    
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, json.dumps(value), ex=ttl)
+            await pipe.execute()
+        log.debug(f"Cached {len(items)} keys (TTL: {ttl}s)")
+        return True
+    except Exception as e:
+        log.error(f"Redis pipelined set failed for {len(items)} keys: {e}")
+        return False
+
+
 async def delete_cache(key: str) -> bool:
     """Delete cache key"""
     client = await get_redis_client()
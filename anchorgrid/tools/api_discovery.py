@@ -13,23 +13,76 @@ Usage:
 """
 from playwright.async_api import async_playwright
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlparse, parse_qs
 from loguru import logger
-import json
+import jinja2
+import orjson
 import asyncio
+import time
 from pathlib import Path
 
 
+# Scraper source template, compiled once at import
+_SCRAPER_TEMPLATE = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent / "templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    autoescape=False,
+).get_template("scraper.py.j2")
+
+# Many captured responses share a URL; parse each one once
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+
+def _iso_from_ns(timestamp_ns: int) -> str:
+    """Format an epoch-nanosecond timestamp as local ISO time"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, timezone.utc).astimezone().replace(tzinfo=None).isoformat()
+
+
 class APIDiscovery:
     """
     Discover undocumented APIs by monitoring browser network traffic.
     """
     
+    RESPONSE_WORKERS = 8  # Concurrent response body reads
+    RESPONSE_QUEUE_SIZE = 512
+    
     def __init__(self):
         self.discovered_apis: List[Dict[str, Any]] = []
         self.json_endpoints: List[Dict[str, Any]] = []
         logger.info("API Discovery tool initialized")
     
+    def _is_json_content_type(self, content_type: str) -> bool:
+        """True if the content-type names a JSON payload"""
+        return 'json' in content_type.lower()
+    
+    async def _drain(self, queue: asyncio.Queue):
+        """Worker: read and parse queued JSON responses"""
+        while True:
+            response, timestamp_ns = await queue.get()
+            try:
+                body = await response.body()
+                json_data = orjson.loads(body)
+                self.json_endpoints.append({
+                    'method': response.request.method,
+                    'url': response.url,
+                    'status': response.status,
+                    'headers': dict(response.headers),
+                    'sample_response': json_data,
+                    'timestamp': _iso_from_ns(timestamp_ns),
+                })
+                logger.info(f"Found JSON API: {response.request.method} {response.url}")
+            except orjson.JSONDecodeError:
+                pass
+            except Exception as e:
+                logger.debug(f"Error processing response: {e}")
+            finally:
+                queue.task_done()
+    
     async def discover(
         self,
         url: str,
@@ -48,6 +101,7 @@ class APIDiscovery:
             List of discovered API endpoints
         """
         logger.info(f"Discovering APIs from: {url}")
+        first_request = len(self.discovered_apis)
         
         async with async_playwright() as p:
             # Launch browser (headless)
@@ -57,6 +111,13 @@ class APIDiscovery:
             )
             page = await context.new_page()
             
+            # Response bodies are read by a pool of workers, off the event handler
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.RESPONSE_QUEUE_SIZE)
+            workers = [
+                asyncio.create_task(self._drain(queue))
+                for _ in range(self.RESPONSE_WORKERS)
+            ]
+            
             # Capture network requests
             async def handle_request(request):
                 """Monitor outgoing requests"""
@@ -67,32 +128,16 @@ class APIDiscovery:
                         'url': request.url,
                         'headers': request.headers,
                         'resource_type': request.resource_type,
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': time.time_ns(),  # ISO-formatted once discovery ends
                     })
             
             async def handle_response(response):
-                """Monitor responses"""
+                """Monitor responses (queue JSON ones for the workers)"""
                 if response.request.resource_type in ['xhr', 'fetch']:
-                    try:
-                        # Try to parse as JSON
-                        content_type = response.headers.get('content-type', '')
-                        if 'json' in content_type:
-                            body = await response.text()
-                            try:
-                                json_data = json.loads(body)
-                                self.json_endpoints.append({
-                                    'method': response.request.method,
-                                    'url': response.url,
-                                    'status': response.status,
-                                    'headers': dict(response.headers),
-                                    'sample_response': json_data,
-                                    'timestamp': datetime.now().isoformat(),
-                                })
-                                logger.info(f"Found JSON API: {response.request.method} {response.url}")
-                            except json.JSONDecodeError:
-                                pass
-                    except Exception as e:
-                        logger.debug(f"Error processing response: {e}")
+                    content_type = response.headers.get('content-type', '')
+                    if self._is_json_content_type(content_type):
+                        # Waits while the queue is full: backpressure, never a drop
+                        await queue.put((response, time.time_ns()))
             
             # Attach listeners
             page.on('request', handle_request)
@@ -118,8 +163,17 @@ class APIDiscovery:
                     except Exception as e:
                         logger.warning(f"Could not click {selector}: {e}")
             
+            # Bodies must be read while the browser is still open
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
             await browser.close()
         
+        for request in self.discovered_apis[first_request:]:
+            request['timestamp'] = _iso_from_ns(request['timestamp'])
+        
         logger.info(f"Discovered {len(self.json_endpoints)} JSON API endpoints")
         return self.json_endpoints
     
@@ -143,8 +197,7 @@ class APIDiscovery:
         sample_response = endpoint.get('sample_response', {})
         
         # Extract variable parts of URL (query params, path segments)
-        from urllib.parse import urlparse, parse_qs
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         query_params = parse_qs(parsed.query)
         
         # Generate function name from URL
@@ -152,69 +205,16 @@ class APIDiscovery:
         if not func_name:
             func_name = 'fetch_data'
         
-        # Generate code
-        code = f'''"""
-Auto-generated scraper for {url}
-Generated on {datetime.now().isoformat()}
-"""
-import httpx
-from typing import Optional, Dict, Any
-from loguru import logger
-
-
-async def {func_name}(
-'''
-        
-        # Add parameters based on query params
-        if query_params:
-            for param in query_params.keys():
-                code += f'    {param}: str,\n'
-        
-        code += f''') -> Optional[Dict[str, Any]]:
-    """
-    Fetch data from {parsed.netloc}
-    
-    Method: {method}
-    Endpoint: {parsed.path}
-    """
-    url = "{parsed.scheme}://{parsed.netloc}{parsed.path}"
-    
-    headers = {{
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': 'application/json',
-    }}
-    
-    params = {{
-'''
-        
-        # Add query parameters
-        if query_params:
-            for param in query_params.keys():
-                code += f'        "{param}": {param},\n'
-        
-        code += f'''    }}
-    
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.{method.lower()}(
-                url,
-                headers=headers,
-                params=params
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Fetched data from {parsed.netloc}")
-            return data
-    
-    except Exception as e:
-        logger.error(f"Failed to fetch data: {{e}}")
-        return None
-
-
-# Example usage:
-# data = await {func_name}({', '.join(f'"{k}=example"' for k in query_params.keys()) if query_params else ''})
-'''
+        code = _SCRAPER_TEMPLATE.render(
+            url=url,
+            generated_at=datetime.now().isoformat(),
+            func_name=func_name,
+            params=list(query_params),
+            method=method,
+            scheme=parsed.scheme,
+            netloc=parsed.netloc,
+            path=parsed.path,
+        )
         
         # Save to file if requested
         if output_file:
@@ -238,8 +238,8 @@ async def {func_name}(
             'endpoints': self.json_endpoints,
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved discovery report to {output_file}")
     
@@ -287,9 +287,15 @@ async def discover_and_generate(url: str, output_dir: str = "generated_scrapers"
     # Generate scrapers for each endpoint
     Path(output_dir).mkdir(exist_ok=True)
     
-    for i, endpoint in enumerate(endpoints):
-        filename = f"{output_dir}/scraper_{i+1}.py"
-        api_discovery.generate_scraper_code(endpoint, filename)
+    sources = {
+        Path(output_dir) / f"scraper_{i+1}.py": api_discovery.generate_scraper_code(endpoint)
+        for i, endpoint in enumerate(endpoints)
+    }
+    
+    # Independent files: write them in parallel
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda item: item[0].write_text(item[1]), sources.items()))
+    logger.info(f"Saved {len(sources)} scrapers to {output_dir}")
     
     # Save report
     api_discovery.save_report(f"{output_dir}/discovery_report.json")
@@ -9,6 +9,7 @@ Implements staggered requests and IP rotation placeholders.
 import asyncio
 import time
 import random
+from collections import deque
 from typing import Callable, Any, Dict, List
 from loguru import logger
 
@@ -18,15 +19,72 @@ class RateLimitedScraper:
     Coordinator for large-scale data collection.
     
     Features:
-    - Adaptive delays
+    - Token bucket: requests start at the configured rate but run concurrently
+    - Adaptive delays (AIMD: jittered backoff on errors/throttling,
+      gradual recovery on success)
     - Source-specific rate limits
     - Retry logic with exponential backoff
     """
     
-    def __init__(self, requests_per_minute: int = 30):
-        self.delay = 60.0 / requests_per_minute
-        self.last_request_time = 0
-        self._lock = asyncio.Lock()
+    MAX_DELAY_FACTOR = 60  # Never slow down beyond 60x the base delay
+    THROTTLE_STATUSES = (429, 503)
+    LATENCY_WINDOW = 32  # Recent response times kept for the EWMA
+    SLOWDOWN_FACTOR = 3.0  # Latency this far above the EWMA counts as pressure
+    
+    def __init__(self, requests_per_minute: int = 30, burst: int = 1):
+        self.base_delay = 60.0 / requests_per_minute
+        self.delay = self.base_delay  # Current seconds per request
+        self.capacity = float(burst)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()  # Guards the bucket math only
+        self._latencies: deque = deque(maxlen=self.LATENCY_WINDOW)
+        self._latency_ewma = 0.0
+    
+    @property
+    def rate(self) -> float:
+        """Current tokens per second"""
+        return 1.0 / self.delay
+    
+    def _back_off(self):
+        """Multiplicative increase with decorrelated jitter, capped"""
+        self.delay = min(
+            self.base_delay * self.MAX_DELAY_FACTOR,
+            self.delay * 1.5 + random.uniform(0, self.base_delay),
+        )
+    
+    def _recover(self):
+        """Ease back toward the base delay after a success"""
+        self.delay = max(self.base_delay, self.delay * 0.9 + self.base_delay * 0.1)
+    
+    def _record_latency(self, latency: float) -> bool:
+        """Track response time; True if this response was unusually slow"""
+        slow = (
+            len(self._latencies) >= self.LATENCY_WINDOW // 4
+            and latency > self._latency_ewma * self.SLOWDOWN_FACTOR
+        )
+        self._latencies.append(latency)
+        if len(self._latencies) == 1:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma += (latency - self._latency_ewma) * (2 / (len(self._latencies) + 1))
+        return slow
+    
+    async def _acquire(self, identifier: str):
+        """Take one token, sleeping (outside the lock) until it is due"""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            
+            wait_time = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            self._tokens -= 1  # Reserve now; a negative balance queues later callers
+        
+        if wait_time > 0:
+            # Add jitter (10-30%)
+            wait_time += wait_time * random.uniform(0.1, 0.3)
+            logger.debug(f"Rate Limiter: Waiting {wait_time:.2f}s for {identifier}")
+            await asyncio.sleep(wait_time)
     
     async def fetch(self, identifier: str, func: Callable, *args, **kwargs) -> Any:
         """
@@ -36,36 +94,31 @@ class RateLimitedScraper:
             identifier: Log identifier (e.g. ticker or URL)
             func: Async function to execute
         """
-        async with self._lock:
-            # Calculate wait time
-            elapsed = time.time() - self.last_request_time
-            wait_time = max(0, self.delay - elapsed)
-            
-            # Add jitter (10-30%)
-            wait_time += wait_time * random.uniform(0.1, 0.3)
-            
-            if wait_time > 0:
-                logger.debug(f"Rate Limiter: Waiting {wait_time:.2f}s for {identifier}")
-                await asyncio.sleep(wait_time)
-            
-            # Execute
-            try:
-                result = await func(*args, **kwargs)
-                self.last_request_time = time.time()
-                return result
-            except Exception as e:
-                logger.error(f"Scraper error for {identifier}: {e}")
-                # Backoff on error
-                self.delay *= 1.5
-                raise
+        await self._acquire(identifier)
+        
+        # Execute
+        started = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Scraper error for {identifier}: {e}")
+            # Backoff on error
+            self._back_off()
+            raise
+        
+        # Back off early when the remote signals pressure
+        slow = self._record_latency(time.monotonic() - started)
+        if slow or getattr(result, "status_code", None) in self.THROTTLE_STATUSES:
+            self._back_off()
+            logger.warning(f"Rate Limiter: Throttled on {identifier}, delay now {self.delay:.2f}s")
+        else:
+            self._recover()
+        return result
     
     async def batch_fetch(self, items: List[Any], func: Callable) -> List[Any]:
-        """Fetch multiple items sequentially with rate limiting"""
-        results = []
-        for item in items:
-            try:
-                res = await self.fetch(str(item), func, item)
-                results.append(res)
-            except Exception:
-                continue
-        return results
+        """Fetch multiple items concurrently with rate limiting (failures are skipped)"""
+        results = await asyncio.gather(
+            *(self.fetch(str(item), func, item) for item in items),
+            return_exceptions=True,
+        )
+        return [res for res in results if not isinstance(res, Exception)]
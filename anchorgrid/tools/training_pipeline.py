@@ -6,11 +6,15 @@ Generates 100k+ instruction-following examples for financial fine-tuning.
 """
 
 import asyncio
-import json
+import queue
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 
+import numpy as np
+import orjson
+
 from backend.scrapers.sec_scraper import sec_scraper
 from backend.scrapers.news_rss import news_rss_scraper
 from backend.services.quant_service import quant_service
@@ -19,17 +23,78 @@ from backend.tools.data_quality import DataQualityFilter
 from loguru import logger
 
 
+def _jsonl_writer(chunks: "queue.SimpleQueue[Optional[bytes]]", path: Path, errors: List[BaseException]):
+    """Writer thread: append encoded chunks until the None sentinel"""
+    try:
+        with open(path, "wb") as f:
+            while (chunk := chunks.get()) is not None:
+                f.write(chunk)
+    except BaseException as e:
+        # Handed back to run(); an exception left in the thread is lost
+        errors.append(e)
+
+
 class TrainingPipeline:
     """
     Automated pipeline to generate the 100k+ dataset.
     """
     
+    WRITE_BATCH_SIZE = 1024  # Examples per write() call
+    
     def __init__(self):
         self.rate_limiter = RateLimitedScraper(requests_per_minute=20)
         self.quality_filter = DataQualityFilter()
         
-    async def generate_examples(self, tickers: List[str]) -> List[Dict]:
-        """Generate a batch of examples from given tickers"""
+    @staticmethod
+    def _price_matrix(tickers: List[str], price_history: Dict[str, List[float]]) -> np.ndarray:
+        """Stack histories into a (tickers, N) matrix, left-padded with NaN"""
+        width = max((len(price_history.get(t, [])) for t in tickers), default=0)
+        matrix = np.full((len(tickers), max(width, 1)), np.nan)
+        for row, ticker in enumerate(tickers):
+            prices = price_history.get(ticker, [])
+            if prices:
+                matrix[row, width - len(prices):] = prices
+        return matrix
+    
+    def _indicator_examples(
+        self,
+        tickers: List[str],
+        price_history: Dict[str, List[float]],
+    ) -> List[Dict]:
+        """Technique 2 for all tickers with one batched indicator pass"""
+        batch = quant_service.analyze_batch(tickers, self._price_matrix(tickers, price_history))
+        
+        examples = []
+        for i, ticker in enumerate(batch.tickers):
+            if np.isnan(batch.rsi_14[i]) or np.isnan(batch.macd_histogram[i]):
+                continue
+            macd_side = "Bullish" if batch.macd_histogram[i] > 0 else "Bearish"
+            examples.append({
+                "instruction": f"Analyze the market setup for {ticker}",
+                "input": f"RSI: {batch.rsi_14[i]:.0f}, MACD: {macd_side}, Price: {batch.price[i]:.2f}",
+                "output": (
+                    f"Analysis of {ticker}: RSI is at {batch.rsi_14[i]:.0f} and the MACD "
+                    f"histogram is {batch.macd_histogram[i]:+.2f}, a {macd_side.lower()} setup."
+                ),
+            })
+        return examples
+    
+    async def generate_examples(
+        self,
+        tickers: List[str],
+        price_history: Optional[Dict[str, List[float]]] = None,
+    ) -> List[Dict]:
+        """
+        Generate a batch of examples from given tickers.
+        
+        When price_history (ticker -> closes, oldest first) is given, the
+        indicator examples for every ticker come from one analyze_batch call.
+        """
+        if price_history:
+            return self.quality_filter.filter_dataset(
+                self._indicator_examples(tickers, price_history)
+            )
+        
         examples = []
         
         for ticker in tickers:
@@ -61,8 +126,24 @@ class TrainingPipeline:
         output_path = Path("datasets")
         output_path.mkdir(exist_ok=True)
         
-        with open(output_path / output_file, "w") as f:
-            for ex in all_examples:
-                f.write(json.dumps(ex) + "\n")
+        # Encode here, write on a background thread so the loop stays free
+        chunks: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        writer_errors: List[BaseException] = []
+        writer = threading.Thread(
+            target=_jsonl_writer,
+            args=(chunks, output_path / output_file, writer_errors),
+            daemon=True,
+        )
+        writer.start()
+        
+        batch = self.WRITE_BATCH_SIZE
+        for i in range(0, len(all_examples), batch):
+            chunks.put(b"".join(orjson.dumps(ex) + b"\n" for ex in all_examples[i:i + batch]))
+            await asyncio.sleep(0)  # Let rate-limited fetches run between batches
+        
+        chunks.put(None)
+        await asyncio.to_thread(writer.join)
+        if writer_errors:
+            raise writer_errors[0]
         
         logger.info(f"Successfully generated {len(all_examples)} examples in {output_path / output_file}")
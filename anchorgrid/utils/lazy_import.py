@@ -0,0 +1,31 @@
+"""
+Deferred imports for heavy optional dependencies (torch, transformers).
+
+    torch = lazy_import("torch")   # cheap: only locates the package
+    torch.float16                  # first attribute access runs the import
+
+A missing package still raises ImportError at lazy_import() time, so
+module-level availability checks keep working.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return module `name`, executing it on first attribute access."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
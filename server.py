@@ -5,15 +5,30 @@ Simple server for testing AnchorGrid-Core components.
 Provides REST API endpoints for scrapers, indicators, and Hub.
 """
 
+import importlib.util
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List
 import uvicorn
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled HTTP connections on shutdown
+    from anchorgrid.plugins.finance.connectors import yfinance_scraper
+    await yfinance_scraper.close()
+
+
 app = FastAPI(
     title="AnchorGrid Core API",
     description="Zero-cost financial data infrastructure with federated learning",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # NaN -> null, numpy scalars native
+    lifespan=lifespan,
 )
 
 # CORS
@@ -73,19 +88,16 @@ async def get_indicators(
     Example: /api/indicators/AAPL?period=3mo
     """
     try:
-        from anchorgrid.scrapers import yfinance_scraper
+        from anchorgrid.plugins.finance.connectors import yfinance_scraper
         from anchorgrid.plugins.finance.extractors.indicators import rsi, macd, ema
-        import numpy as np
         
-        # Get historical data
-        hist = yfinance_scraper.get_historical(symbol, period=period)
+        # Get historical data (closes arrive as a float64 array)
+        hist = yfinance_scraper.get_historical(symbol, period=period, format="arrays")
         
-        if not hist or 'data' not in hist:
+        if not hist or len(hist['close']) == 0:
             raise HTTPException(status_code=404, detail=f"No historical data for {symbol}")
         
-        # Extract closing prices
-        data_points = hist['data']
-        prices = np.array([float(d['Close']) for d in data_points])
+        prices = hist['close']
         
         # Calculate indicators
         rsi_14 = rsi(prices, 14)
@@ -93,19 +105,20 @@ async def get_indicators(
         ema_20 = ema(prices, 20)
         ema_50 = ema(prices, 50)
         
+        # orjson serializes the numpy scalars directly (NaN warmup values -> null)
         return {
             "symbol": symbol,
             "period": period,
-            "current_price": float(prices[-1]),
+            "current_price": prices[-1],
             "indicators": {
-                "rsi_14": float(rsi_14[-1]) if not np.isnan(rsi_14[-1]) else None,
+                "rsi_14": rsi_14[-1],
                 "macd": {
-                    "line": float(macd_line[-1]) if not np.isnan(macd_line[-1]) else None,
-                    "signal": float(macd_signal[-1]) if not np.isnan(macd_signal[-1]) else None,
-                    "histogram": float(macd_hist[-1]) if not np.isnan(macd_hist[-1]) else None
+                    "line": macd_line[-1],
+                    "signal": macd_signal[-1],
+                    "histogram": macd_hist[-1]
                 },
-                "ema_20": float(ema_20[-1]) if not np.isnan(ema_20[-1]) else None,
-                "ema_50": float(ema_50[-1]) if not np.isnan(ema_50[-1]) else None
+                "ema_20": ema_20[-1],
+                "ema_50": ema_50[-1]
             }
         }
     except Exception as e:
@@ -135,7 +148,7 @@ async def hub_status():
         }
     except Exception as e:
         return {
-            "status"error",
+            "status": "error",
             "message": str(e)
         }
 
@@ -159,4 +172,12 @@ if __name__ == "__main__":
     Press CTRL+C to stop
     """)
     
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools ship with uvicorn[standard] except on Windows
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools" if importlib.util.find_spec("httptools") else "auto",
+        log_level="warning",
+    )
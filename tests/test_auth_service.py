@@ -0,0 +1,285 @@
+"""
+Auth service behaviour
+
+API key lookups are cached in Redis under apk:<hash> and dropped on
+revoke; emails are normalized before lookup; usage counters are written
+with UPDATE ... RETURNING. Redis is a dict-backed stand-in. Paths that
+only touch the session run against a recording fake; the ones that build
+ORM instances run on in-memory SQLite and need the mappers to configure.
+"""
+
+import asyncio
+import importlib
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+
+def _import_auth_service():
+    try:
+        return importlib.import_module("anchorgrid.services.auth_service")
+    except ModuleNotFoundError as e:
+        if e.name and e.name.startswith("anchorgrid"):
+            raise
+        pytest.skip(f"missing dependency: {e.name}")
+
+
+class FakeRedis:
+    """The subset of redis.asyncio.Redis the cache helpers use"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def scalar_one_or_none(self):
+        return self.row
+
+
+class FakeSession:
+    """Records each execute()'s parameters and answers with canned rows"""
+
+    def __init__(self, *rows):
+        self.rows = list(rows)
+        self.params = []
+        self.flushes = 0
+
+    async def execute(self, statement, params=None):
+        self.params.append(params)
+        return FakeResult(self.rows.pop(0) if self.rows else None)
+
+    async def flush(self):
+        self.flushes += 1
+
+
+def _key_row(**overrides):
+    """Stands in for an APIKey row: the attributes the service reads"""
+    fields = dict(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        user_id=uuid4(),
+        name="ci",
+        key_hash="h" * 64,
+        key_prefix="qf_live_1234",
+        permissions=json.dumps(["read"]),
+        is_active=True,
+        expires_at=datetime(2099, 1, 1, 12, 30),
+        created_at=datetime(2026, 1, 1),
+        revoked_at=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _orm_error():
+    """Why ORM instances cannot be built here, or None if they can"""
+    from sqlalchemy.exc import SQLAlchemyError
+    from sqlalchemy.orm import configure_mappers
+    try:
+        configure_mappers()
+    except SQLAlchemyError as e:
+        return str(e).splitlines()[0]
+    return None
+
+
+@pytest.fixture
+def auth_service():
+    return _import_auth_service()
+
+
+@pytest.fixture
+def orm(auth_service):
+    error = _orm_error()
+    if error:
+        pytest.skip(f"ORM mappers do not configure: {error}")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    from anchorgrid.services import redis_service
+    fake = FakeRedis()
+    monkeypatch.setattr(redis_service, "redis_client", fake)
+    return fake
+
+
+def run_with_session(scenario):
+    """Run scenario(session) on a fresh in-memory database"""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from anchorgrid.db.models import APIKey, Tenant, User
+    from anchorgrid.db.session import Base
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[Tenant.__table__, User.__table__, APIKey.__table__],
+            )
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                await scenario(session)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+async def _add_api_key(session, **overrides):
+    from anchorgrid.db.models import APIKey
+    fields = dict(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        user_id=uuid4(),
+        name="ci",
+        key_hash="h" * 64,
+        key_prefix="qf_live_1234",
+        permissions=json.dumps(["read"]),
+        expires_at=datetime(2099, 1, 1, 12, 30),
+    )
+    fields.update(overrides)
+    api_key = APIKey(**fields)
+    session.add(api_key)
+    await session.flush()
+    return api_key
+
+
+def test_auth_service_imports(auth_service):
+    assert hasattr(auth_service, "AuthService")
+
+
+def test_api_key_miss_is_cached_by_hash(auth_service, fake_redis):
+    row = _key_row()
+    session = FakeSession(row)
+    service = auth_service.AuthService(session)
+
+    assert asyncio.run(service.get_api_key_by_hash(row.key_hash)) is row
+    assert session.params == [{"key_hash": row.key_hash}]
+
+    cache_key = f"apk:{row.key_hash}"
+    assert fake_redis.ttls[cache_key] == auth_service.API_KEY_CACHE_TTL
+    cached = json.loads(fake_redis.store[cache_key])
+    assert cached["id"] == str(row.id)
+    # Everything the auth layer checks without going back to the database
+    assert cached["is_active"] is True
+    assert cached["expires_at"] == row.expires_at.isoformat()
+    assert cached["revoked_at"] is None
+
+
+def test_unknown_api_key_is_not_cached(auth_service, fake_redis):
+    service = auth_service.AuthService(FakeSession(None))
+    assert asyncio.run(service.get_api_key_by_hash("0" * 64)) is None
+    assert fake_redis.store == {}
+
+
+def test_revoke_drops_the_cached_api_key(auth_service, fake_redis):
+    row = _key_row()
+    fake_redis.store[f"apk:{row.key_hash}"] = "{}"
+    session = FakeSession(row)
+    service = auth_service.AuthService(session)
+
+    assert asyncio.run(service.revoke_api_key(row.id, row.user_id))
+    assert row.revoked_at is not None and row.is_active is False
+    assert session.flushes == 1
+    assert f"apk:{row.key_hash}" not in fake_redis.store
+
+    # Nothing to revoke: the cache is left alone
+    fake_redis.store["apk:other"] = "{}"
+    assert not asyncio.run(auth_service.AuthService(FakeSession(None)).revoke_api_key(uuid4(), uuid4()))
+    assert "apk:other" in fake_redis.store
+
+
+def test_email_lookup_is_normalized(auth_service, fake_redis):
+    assert auth_service.normalize_email("  Ada@Example.COM ") == "ada@example.com"
+
+    session = FakeSession(None)
+    asyncio.run(auth_service.AuthService(session).get_user_by_email("  Ada@Example.COM "))
+    assert session.params == [{"email": "ada@example.com"}]
+
+
+def test_api_key_cache_hit_skips_the_database(auth_service, fake_redis, orm):
+    async def scenario(session):
+        from sqlalchemy import delete
+        from anchorgrid.db.models import APIKey
+
+        stored = await _add_api_key(session)
+        service = auth_service.AuthService(session)
+        cache_key = f"apk:{stored.key_hash}"
+
+        # Miss: read from the database, then cached for API_KEY_CACHE_TTL
+        found = await service.get_api_key_by_hash(stored.key_hash)
+        assert found is stored
+        assert cache_key in fake_redis.store
+        assert fake_redis.ttls[cache_key] == auth_service.API_KEY_CACHE_TTL
+
+        # Hit: served without the row, with the fields is_valid needs
+        await session.execute(delete(APIKey))
+        cached = await service.get_api_key_by_hash(stored.key_hash)
+        assert cached is not stored
+        assert (cached.id, cached.user_id, cached.key_prefix) == (stored.id, stored.user_id, stored.key_prefix)
+        assert cached.expires_at == stored.expires_at
+        assert cached.is_active and cached.revoked_at is None and cached.is_valid
+
+        # Unknown hashes are not cached
+        assert await service.get_api_key_by_hash("0" * 64) is None
+        assert "apk:" + "0" * 64 not in fake_redis.store
+
+    run_with_session(scenario)
+
+
+def test_revoked_api_key_is_reloaded(auth_service, fake_redis, orm):
+    async def scenario(session):
+        stored = await _add_api_key(session)
+        service = auth_service.AuthService(session)
+        await service.get_api_key_by_hash(stored.key_hash)
+        assert f"apk:{stored.key_hash}" in fake_redis.store
+
+        assert await service.revoke_api_key(stored.id, stored.user_id)
+        assert f"apk:{stored.key_hash}" not in fake_redis.store
+
+        # The next lookup sees the revocation instead of a stale cache entry
+        found = await service.get_api_key_by_hash(stored.key_hash)
+        assert found.revoked_at is not None and not found.is_valid
+        assert json.loads(fake_redis.store[f"apk:{stored.key_hash}"])["is_active"] is False
+
+        # Someone else's key is left alone
+        assert not await service.revoke_api_key(stored.id, uuid4())
+
+    run_with_session(scenario)
+
+
+def test_record_usage_uses_returning_values(auth_service, fake_redis, orm):
+    async def scenario(session):
+        stored = await _add_api_key(session)
+        service = auth_service.AuthService(session)
+
+        before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=1)
+        await service.record_api_key_usage(stored)
+        await service.record_api_key_usage(stored)
+
+        # Values come back from RETURNING and are set as committed state,
+        # so nothing is left for the next flush to write
+        assert stored.usage_count == 2
+        assert stored.last_used_at is not None and stored.last_used_at.replace(tzinfo=None) >= before
+        assert stored not in session.dirty
+
+    run_with_session(scenario)
@@ -3,118 +3,303 @@ AnchorGrid-Core Component Test Suite
 Tests all major subsystems after dependency fixes
 """
 
-print("=" * 70)
-print("ANCHORGRID-CORE COMPONENT TEST SUITE")
-print("=" * 70)
+import importlib
+import sys
+from collections import namedtuple
+from functools import partial
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-# Test 1: Package Import
-print("\n[1/7] Testing Package Import...")
-try:
-    import anchorgrid
-    print(f"✅ Package imports successfully - v{anchorgrid.__version__}")
-except Exception as e:
-    print(f"❌ FAILED: {e}")
+# Resolve anchorgrid from this checkout, without relying on PYTHONPATH or
+# an editable install; inserted once even if the script is re-run in-process
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-# Test 2: Database Models
-print("\n[2/7] Testing Database Models...")
-try:
-    from anchorgrid.db.models import (
-        Tenant, User, APIKey, Portfolio, Position,
-        UserActivityEvent, UserInterest
-    )
-    print(f"✅ All 7 core models import:")
-    print(f"   - {Tenant.__name__}, {User.__name__}, {APIKey.__name__}")
-    print(f"   - {Portfolio.__name__}, {Position.__name__}")
-    print(f"   - {UserActivityEvent.__name__}, {UserInterest.__name__}")
-except Exception as e:
-    print(f"❌ FAILED: {e}")
-
-# Test 3: Indicators
-print("\n[3/7] Testing Indicators...")
-try:
-    from anchorgrid.plugins.finance.extractors.indicators import rsi, macd, sma, ema
-    import numpy as np
-    prices = np.array([100.0, 102, 101, 103, 105, 104, 106, 108, 107, 109] * 2)
-    rsi_val = rsi(prices, 14)
-    print(f"✅ Indicators work (RSI calculated for 20 data points)")
-    print(f"   Available: rsi(), macd(), sma(), ema(), bollinger_bands()")
-except Exception as e:
-    print(f"❌ FAILED: {e}")
-
-# Test 4: Scrapers (instances from __init__.py)
-print("\n[4/7] Testing Scrapers...")
-try:
+if TYPE_CHECKING:
+    # Static view of the scraper probe; at runtime the names are resolved
+    # one by one through the connectors package's lazy __getattr__
     from anchorgrid.plugins.finance.connectors import (
         yfinance_scraper, sec_scraper, fred_scraper,
         nasdaq_scraper, marketwatch_scraper, news_rss_scraper
     )
-    print(f"✅ All 6 scrapers initialized:")
-    print(f"   - yfinance_scraper (Primary)")
-    print(f"   - sec_scraper (SEC EDGAR - No API key)")
-    print(f"   - fred_scraper (Federal Reserve - No API key)")
-    print(f"   - nasdaq_scraper, marketwatch_scraper (Backups)")
-    print(f"   - news_rss_scraper (RSS feeds)")
-except Exception as e:
-    print(f"❌ FAILED: {e}")
-
-# Test 5: Hub Infrastructure
-print("\n[5/7] Testing Hub (Federated Learning)...")
-try:
-    from anchorgrid.hub.registry import AdapterRegistry
-    from anchorgrid.hub.merging import merge_adapters
-    from anchorgrid.hub.evaluation import evaluate_adapter
-    print(f"✅ Hub components ready:")
-    print(f"   - AdapterRegistry (model tracking)")
-    print(f"   - merge_adapters() (LoRA merging)")
-    print(f"   - evaluate_adapter() (Proof of Loss)")
-except Exception as e:
-    print(f"❌ FAILED: {e}")
-
-# Test 6: CLI Tool
-print("\n[6/7] Testing CLI...")
-try:
-    from anchorgrid.cli import app
-    print(f"✅ CLI tool ready:")
-    print(f"   Commands: login, push, status, leaderboard, version")
-except Exception as e:
-    print(f"❌ FAILED: {e}")
-
-# Test 7: Agents (may fail due to service dependencies)
-print("\n[7/7] Testing Agents...")
+
 try:
-    # Direct import to avoid service chain
-    import sys
-    import importlib.util
-    
-    spec = importlib.util.spec_from_file_location(
-        "orchestrator", "d:/AnchorGrid-Core/anchorgrid/agents/orchestrator.py"
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Indicator fixture, built once per run and read-only so any in-place
+# mutation inside the indicators fails loudly
+if NUMPY_AVAILABLE:
+    PRICES = np.asarray(
+        [100.0, 102, 101, 103, 105, 104, 106, 108, 107, 109] * 2, dtype=np.float64
+    )
+    PRICES.setflags(write=False)
+    # Penny-tick random walk: the same few returns recur, so many rolling
+    # volatility windows tie (this seed sits on the 75th percentile)
+    TIED_CLOSE = np.round(5 + np.cumsum(np.random.default_rng(78).choice([-0.01, 0.0, 0.01], 100)), 2)
+    TIED_CLOSE.setflags(write=False)
+else:
+    PRICES = TIED_CLOSE = None
+
+BAR = "=" * 70
+
+HEADER = "\n".join([
+    BAR,
+    "ANCHORGRID-CORE COMPONENT TEST SUITE",
+    BAR,
+])
+
+SUMMARY = "\n".join([
+    "",
+    BAR,
+    "TEST SUMMARY",
+    BAR,
+    "",
+    "✅ WORKING:",
+    "   1. Package import (v1.0.0)",
+    "   2. Database models (7 models)",
+    "   3. Indicators (RSI, MACD, etc.)",
+    "   4. Scrapers (6 zero-cost scrapers)",
+    "   5. Hub infrastructure (registry, merging, evaluation)",
+    "   6. CLI tool (5 commands)",
+    "",
+    "⚠️  BLOCKED:",
+    "   7. Agents (needs service layer fixes)",
+    "   8. Services (redis_service needs logger import fix)",
+    "",
+    "🎯 NEXT STEPS:",
+    "   - Fix: anchorgrid.services.redis_service (line 8)",
+    "     Change: from anchorgrid.core.logger import log",
+    "     To:     from loguru import logger as log",
+    "   - Then test Agents, Services, full ML pipeline",
+    BAR,
+])
+
+# ok=True passed, False failed, None blocked/skipped
+Result = namedtuple("Result", "idx name ok detail")
+TAGS = {True: "✅ ", False: "❌ ", None: "⚠️  "}
+
+SCRAPERS = (
+    "yfinance_scraper", "sec_scraper", "fred_scraper",
+    "nasdaq_scraper", "marketwatch_scraper", "news_rss_scraper",
+)
+
+# Core models, in the report's grouping; the lines are joined once here
+# instead of from each class's __name__ on every run
+MODEL_GROUPS = (
+    ("Tenant", "User", "APIKey"),
+    ("Portfolio", "Position"),
+    ("UserActivityEvent", "UserInterest"),
+)
+MODELS = tuple(name for group in MODEL_GROUPS for name in group)
+MODEL_LINES = "\n".join(f"   - {', '.join(group)}" for group in MODEL_GROUPS)
+
+# Import-only probes: (module, names it must expose, report)
+IMPORT_PROBES = {
+    "package": ("anchorgrid", (), "Package imports successfully"),
+    "db_models": ("anchorgrid.db.models", MODELS, "\n".join([
+        f"All {len(MODELS)} core models import:",
+        MODEL_LINES,
+    ])),
+    "hub": ("anchorgrid.hub", (
+        "AnchorGridHub", "merge_adapters", "ProofOfLoss",
+    ), "\n".join([
+        "Hub components ready:",
+        "   - AdapterRegistry (model tracking)",
+        "   - merge_adapters() (LoRA merging)",
+        "   - evaluate_adapter() (Proof of Loss)",
+    ])),
+    "cli": ("anchorgrid.cli", ("app",), "\n".join([
+        "CLI tool ready:",
+        "   Commands: login, push, status, leaderboard, version",
+    ])),
+}
+
+# Probes run one after another: they are not independent imports (the
+# agents probe alone pulls in db.models, connectors, indicators and the
+# services), and concurrent first imports of a shared package can see it
+# half-initialised. Their output is written afterwards, in one go, in the
+# original [k/7] order. (Named check_* so pytest does not collect them.)
+
+
+def _is_optional(e: ImportError) -> bool:
+    """A missing third-party package (torch, peft, ...) rather than a broken anchorgrid import"""
+    return not (e.name or "").startswith("anchorgrid")
+
+
+def check_import(dotted: str, names: tuple[str, ...], report: str) -> tuple[Optional[bool], str]:
+    try:
+        module = importlib.import_module(dotted)
+        # hasattr() resolves lazy exports, so it can hit the same ImportError
+        missing = [name for name in names if not hasattr(module, name)]
+    except ImportError as e:
+        if not _is_optional(e):
+            raise
+        return None, f"{dotted} skipped: missing {e.name}"
+    if missing:
+        return False, f"FAILED: {dotted} has no {', '.join(missing)}"
+    if not names:
+        # Installed metadata is a single file read; source checkouts that
+        # were never pip-installed fall back to the package attribute
+        try:
+            version = metadata.version(dotted)
+        except metadata.PackageNotFoundError:
+            version = module.__version__
+        return True, f"{report} - v{version}"
+    return True, report
+
+
+def check_indicators() -> tuple[Optional[bool], str]:
+    from anchorgrid.plugins.finance.extractors.indicators import (
+        NUMBA_AVAILABLE, _rsi_kernel, rsi, rsi_last, macd, sma, ema,
     )
-    if spec and spec.loader:
-        module = importlib.util.module_from_spec(spec)
-        # This will likely fail, but let's see why
-        print(f"⚠️  Agent imports blocked by service dependencies")
-        print(f"   (Services need Redis/logger fixes)")
-    else:
-        print(f"❌ Could not load module spec")
-except Exception as e:
-    print(f"⚠️  Agent tests skipped: {type(e).__name__}")
-
-print("\n" + "=" * 70)
-print("TEST SUMMARY")
-print("=" * 70)
-print("\n✅ WORKING:")
-print("   1. Package import (v1.0.0)")
-print("   2. Database models (7 models)")
-print("   3. Indicators (RSI, MACD, etc.)")
-print("   4. Scrapers (6 zero-cost scrapers)")
-print("   5. Hub infrastructure (registry, merging, evaluation)")
-print("   6. CLI tool (5 commands)")
-print("\n⚠️  BLOCKED:")
-print("   7. Agents (needs service layer fixes)")
-print("   8. Services (redis_service needs logger import fix)")
-print("\n🎯 NEXT STEPS:")
-print("   - Fix: anchorgrid.services.redis_service (line 8)")
-print("     Change: from anchorgrid.core.logger import log")
-print("     To:     from loguru import logger as log")
-print("   - Then test Agents, Services, full ML pipeline")
-print("=" * 70)
+    # First call compiles the kernel (or loads it from numba's cache)
+    rsi_val = rsi(PRICES, 14)
+    # The jitted Wilder recurrence must match its interpreted source...
+    if NUMBA_AVAILABLE:
+        reference = _rsi_kernel.py_func(PRICES, 14)
+        if not np.allclose(rsi_val, reference, rtol=0, atol=1e-9, equal_nan=True):
+            raise AssertionError("jitted rsi diverges from its Python reference")
+    # ...and the dot-product Wilder path must match the recurrence
+    if abs(rsi_last(PRICES, 14) - rsi_val[-1]) > 1e-9:
+        raise AssertionError(f"rsi_last {rsi_last(PRICES, 14)} != rsi {rsi_val[-1]}")
+    # float32 series stay float32 and agree to single precision
+    rsi_f32 = rsi(PRICES.astype(np.float32), 14)
+    if rsi_f32.dtype != np.float32 or not np.allclose(rsi_f32, rsi_val, atol=1e-3, equal_nan=True):
+        raise AssertionError("float32 rsi diverges from float64")
+    # The regime fast path must rank tied windows exactly as the NumPy one
+    from anchorgrid.plugins.finance.extractors.regime import (
+        detect_volatility_regime, detect_volatility_regime_from_close,
+    )
+    fused = detect_volatility_regime_from_close(TIED_CLOSE)
+    reference = detect_volatility_regime(np.diff(np.log(TIED_CLOSE)))
+    if fused != reference:
+        raise AssertionError(f"volatility regime {fused} != NumPy path {reference}")
+    backend = "numba" if NUMBA_AVAILABLE else "numpy"
+    return True, "\n".join([
+        f"Indicators work (RSI calculated for 20 data points, {backend})",
+        f"   Available: rsi(), macd(), sma(), ema(), bollinger_bands()",
+    ])
+
+
+def check_scrapers() -> tuple[Optional[bool], str]:
+    # Instances from __init__.py, resolved one by one so a missing optional
+    # dependency names the scraper it breaks instead of masking the rest
+    import anchorgrid.plugins.finance.connectors as connectors
+    # Declared names are checked first: costs nothing, imports no scraper
+    undeclared = [name for name in SCRAPERS if name not in connectors.__all__]
+    if undeclared:
+        return False, f"FAILED: connectors does not export {', '.join(undeclared)}"
+    missing = []
+    for name in SCRAPERS:
+        try:
+            getattr(connectors, name)
+        except ImportError as e:
+            if not _is_optional(e):
+                raise
+            missing.append(f"{name} ({e.name})")
+    if missing:
+        return None, f"Scrapers skipped: missing {', '.join(missing)}"
+    return True, "\n".join([
+        f"All 6 scrapers initialized:",
+        f"   - yfinance_scraper (Primary)",
+        f"   - sec_scraper (SEC EDGAR - No API key)",
+        f"   - fred_scraper (Federal Reserve - No API key)",
+        f"   - nasdaq_scraper, marketwatch_scraper (Backups)",
+        f"   - news_rss_scraper (RSS feeds)",
+    ])
+
+
+class _StubPeftModel:
+    """Stands in for a PeftModel: counts merge_and_unload() calls"""
+    
+    def __init__(self):
+        self.merges = 0
+    
+    def merge_and_unload(self):
+        self.merges += 1
+        return object()
+
+
+def check_hub() -> tuple[Optional[bool], str]:
+    ok, detail = check_import(*IMPORT_PROBES["hub"])
+    if not ok:
+        return ok, detail
+    
+    # LoRA merge fast path: folded once per model, cached afterwards,
+    # and never applied to a caller's adapter unless asked for
+    from anchorgrid.hub.evaluation import ProofOfLoss
+    proof = ProofOfLoss()
+    model = _StubPeftModel()
+    proof.evaluate_adapter(model, tokenizer=None, num_examples=1)
+    if model.merges:
+        raise AssertionError("evaluate_adapter merged the adapter without merge=True")
+    if proof._merged_model(model) is not proof._merged_model(model) or model.merges != 1:
+        raise AssertionError("merged LoRA weights are not cached per model")
+    return ok, detail + "\n   - LoRA merge cached per model"
+
+
+def check_agents() -> tuple[Optional[bool], str]:
+    # May fail due to service dependencies
+    import anchorgrid
+    agent_path = Path(anchorgrid.__file__).parent / "agents" / "orchestrator.py"
+    if not agent_path.is_file():
+        return None, f"Agent tests skipped: {agent_path} not found"
+    
+    try:
+        # Reuse the module if another probe already pulled it in
+        module = sys.modules.get("anchorgrid.agents.orchestrator")
+        if module is None:
+            module = importlib.import_module("anchorgrid.agents.orchestrator")
+        return True, f"Agents import: {module.__name__}"
+    except ImportError as e:
+        return None, "\n".join([
+            f"Agent imports blocked by service dependencies",
+            f"   (Missing: {e.name or e})",
+        ])
+    except Exception as e:
+        return None, f"Agent tests skipped: {type(e).__name__}"
+
+
+TESTS = [
+    ("Testing Package Import...", partial(check_import, *IMPORT_PROBES["package"])),
+    ("Testing Database Models...", partial(check_import, *IMPORT_PROBES["db_models"])),
+    ("Testing Indicators...", check_indicators),
+    ("Testing Scrapers...", check_scrapers),
+    ("Testing Hub (Federated Learning)...", check_hub),
+    ("Testing CLI...", partial(check_import, *IMPORT_PROBES["cli"])),
+    ("Testing Agents...", check_agents),
+]
+
+
+# "[k/7] title" headings are fixed once the probe list is
+HEADINGS = tuple(f"\n[{k}/{len(TESTS)}] {title}" for k, (title, _) in enumerate(TESTS, 1))
+
+
+def _run(indexed) -> Result:
+    idx, (name, test) = indexed
+    try:
+        ok, detail = test()
+    except Exception as e:
+        ok, detail = False, f"FAILED: {e}"
+    return Result(idx, name, ok, detail)
+
+
+# Only as a script: pytest imports this file while collecting tests
+if __name__ == "__main__":
+    results = [_run(indexed) for indexed in enumerate(TESTS, 1)]
+
+    lines = [HEADER]
+    for r in results:
+        lines.append(HEADINGS[r.idx - 1])
+        lines.append(TAGS[r.ok] + r.detail)
+    lines.append(SUMMARY)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    # Blocked probes (None) are expected outside a full install; failures are not
+    if any(r.ok is False for r in results):
+        sys.exit(1)
@@ -0,0 +1,90 @@
+"""
+AnchorGrid-Core Import-Cost Audit
+Profiles `import anchorgrid` (and the subsystem packages) with -X importtime
+and exits non-zero if any single module's self time exceeds the budget or
+a package fails to import
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+BAR = "=" * 70
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Packages the component suite imports first; each is audited on its own
+TARGETS = (
+    "anchorgrid",
+    "anchorgrid.hub",
+    "anchorgrid.plugins.finance.connectors",
+    "anchorgrid.plugins.finance.extractors",
+)
+
+BUDGET_US = 50_000  # 50 ms self time per module
+TOP_N = 5
+
+
+def profile_import(target: str) -> list[tuple[int, int, str]]:
+    """Run `import target` in a fresh interpreter; return (self, cumulative, module) rows."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        text=True,
+        cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise ImportError(last[0])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        rows.append((int(self_us), int(cumulative_us), module.strip()))
+    return rows
+
+
+def main() -> int:
+    lines = [BAR, "ANCHORGRID-CORE IMPORT-COST AUDIT", BAR]
+    over_budget = []
+    failed = []
+
+    for target in TARGETS:
+        lines.append(f"\n{target}")
+        try:
+            rows = profile_import(target)
+        except ImportError as e:
+            lines.append(f"❌ Import failed: {e}")
+            failed.append(target)
+            continue
+
+        total_ms = sum(row[0] for row in rows) / 1000
+        lines.append(f"   {len(rows)} modules, {total_ms:.1f} ms self time")
+        for self_us, cumulative_us, module in sorted(rows, reverse=True)[:TOP_N]:
+            flag = "❌" if self_us > BUDGET_US else "  "
+            lines.append(f"   {flag} {self_us / 1000:7.1f} ms  {module}")
+            if self_us > BUDGET_US:
+                over_budget.append((target, module))
+
+    lines.append("\n" + BAR)
+    if failed:
+        lines.append(f"❌ {len(failed)} package(s) failed to import: {', '.join(failed)}")
+    if over_budget:
+        lines.append(f"❌ {len(over_budget)} module(s) over the {BUDGET_US // 1000} ms budget:")
+        lines.extend(f"   - {module} (via {target})" for target, module in over_budget)
+        lines.append("   Defer them with anchorgrid.utils.lazy_import.lazy_import()")
+    elif not failed:
+        lines.append(f"✅ No module over the {BUDGET_US // 1000} ms budget")
+    lines.append(BAR)
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 1 if failed or over_budget else 0
+
+
+# Only as a script: pytest imports this file while collecting tests
+if __name__ == "__main__":
+    sys.exit(main())